@@ -147,34 +147,38 @@ document.addEventListener("DOMContentLoaded", () => {
   }
 
   // Data parsing from HTML
+  // Rows come from the embedded JSON block; pages still using .housing-item divs are read from their data attributes
   function parseHousingDataFromHTML() {
-    const items = housingDataContainer.querySelectorAll(".housing-item")
+    const jsonBlock = document.getElementById("housing-data-json")
+    const rows = jsonBlock
+      ? JSON.parse(jsonBlock.textContent)
+      : Array.from(housingDataContainer.querySelectorAll(".housing-item"), (item) => item.dataset)
     const parsedData = []
-    items.forEach((item) => {
+    rows.forEach((row) => {
       // Handle agency_id as either string or number
-      let agencyId = item.dataset.agency_id;
+      let agencyId = row.agency_id;
       if (!isNaN(agencyId)) {
         agencyId = Number.parseInt(agencyId);
       }
       // Keep as string if it's not a number (like "HUG", "LH", "SH")
 
       parsedData.push({
-        notice_id: Number.parseInt(item.dataset.notice_id),
-        status: item.dataset.status,
-        region_province: item.dataset.region_province,
-        region_city: item.dataset.region_city,
-        address_detail: item.dataset.address_detail,
-        apply_start: item.dataset.apply_start,
-        apply_end: item.dataset.apply_end,
-        house_type: item.dataset.house_type,
-        supply_type_id: Number.parseInt(item.dataset.supply_type_id),
-        application_url: item.dataset.application_url,
-        deposit: Number.parseFloat(item.dataset.deposit),
-        monthly_rent: Number.parseFloat(item.dataset.monthly_rent),
+        notice_id: Number.parseInt(row.notice_id),
+        status: row.status,
+        region_province: row.region_province,
+        region_city: row.region_city,
+        address_detail: row.address_detail,
+        apply_start: row.apply_start,
+        apply_end: row.apply_end,
+        house_type: row.house_type,
+        supply_type_id: Number.parseInt(row.supply_type_id),
+        application_url: row.application_url,
+        deposit: Number.parseFloat(row.deposit),
+        monthly_rent: Number.parseFloat(row.monthly_rent),
         agency_id: agencyId, // Use the processed agency_id
-        income_limit: Number.parseInt(item.dataset.income_limit),
-        asset_limit: Number.parseInt(item.dataset.asset_limit),
-        vehicle_limit: Number.parseInt(item.dataset.vehicle_limit),
+        income_limit: Number.parseInt(row.income_limit),
+        asset_limit: Number.parseInt(row.asset_limit),
+        vehicle_limit: Number.parseInt(row.vehicle_limit),
       })
     })
     return parsedData
@@ -7,31 +7,134 @@ import os
 import pymysql
 from decimal import Decimal
 import datetime
+import functools
+import re
+import gzip
+import hashlib
+import time
+import mmap
+import string
+from html import escape as html_escape
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
 
+# Run asyncio on libuv when uvloop is available; the stock event loop is used otherwise
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
+# orjson encodes/decodes several times faster than the stdlib json module; fall back to json when absent
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_default(obj):
+    """Serialize the DB value types the JSON encoders don't handle natively."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (datetime.date, datetime.datetime)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def json_dumps(obj):
+    """Serialize obj to a JSON str (non-ASCII kept as-is), handling Decimal and dates."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, default=_json_default)
+
+
+def json_dumps_bytes(obj):
+    """Serialize obj to UTF-8 JSON bytes (orjson's native output, no str round-trip)."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, default=_json_default).encode('utf-8')
+
+
+def json_loads(data):
+    """Parse a JSON str or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Secrets keyed by (secret_name, region) - kept for the lifetime of the Lambda container
+_secret_cache = {}
+
+# Secrets Manager clients keyed by region, reused across warm invocations
+_secrets_clients = {}
+
+
+def get_secrets_client(region_name):
+    """Return a shared Secrets Manager client for the region, creating it on first use."""
+    client = _secrets_clients.get(region_name)
+    if client is None:
+        client = boto3.client(
+            'secretsmanager',
+            region_name=region_name,
+            config=Config(
+                retries={'max_attempts': 2, 'mode': 'standard'},
+                connect_timeout=1,
+                read_timeout=3,
+                tcp_keepalive=True
+            )
+        )
+        _secrets_clients[region_name] = client
+    return client
+
+
+def get_secrets_by_name(client, secret_names):
+    """
+    Fetch several JSON secrets with a single BatchGetSecretValue call.
+    Returns a dict mapping each secret's name and ARN to its decoded JSON value,
+    so secret_names may use either form.
+    """
+    response = client.batch_get_secret_value(SecretIdList=secret_names)
+    if response.get('Errors'):
+        failed = ', '.join(err.get('SecretId', '?') for err in response['Errors'])
+        raise Exception(f"Could not read secrets: {failed}")
+    secrets = {}
+    for value in response['SecretValues']:
+        secrets[value['Name']] = secrets[value['ARN']] = json_loads(value['SecretString'])
+    return secrets
+
 
 def get_secret():
     """
     Retrieve secrets from AWS Secrets Manager.
     Works in both Lambda and local environments.
+    Successful lookups are cached so warm invocations skip the Secrets Manager round-trip.
     """
     secret_name = os.environ.get('SECRET_NAME', "wepl-lambda-secrets")
     region_name = os.environ.get('AWS_REGION', "ap-northeast-2")
 
-    try:
-        # Create a Secrets Manager client
-        session = boto3.session.Session()
-        client = session.client(
-            service_name='secretsmanager',
-            region_name=region_name
-        )
+    cache_key = (secret_name, region_name)
+    if cache_key in _secret_cache:
+        return _secret_cache[cache_key]
 
-        get_secret_value_response = client.get_secret_value(
-            SecretId=secret_name
-        )
-        secret = get_secret_value_response['SecretString']
-        return json.loads(secret)
+    try:
+        client = get_secrets_client(region_name)
+
+        # SECRET_NAME may list several comma-separated bundles; they are merged in order
+        secret_names = [name.strip() for name in secret_name.split(',') if name.strip()]
+        if len(secret_names) > 1:
+            secrets_by_name = get_secrets_by_name(client, secret_names)
+            secret = {}
+            for name in secret_names:
+                secret.update(secrets_by_name[name])
+        else:
+            get_secret_value_response = client.get_secret_value(
+                SecretId=secret_name
+            )
+            secret = json_loads(get_secret_value_response['SecretString'])
+        _secret_cache[cache_key] = secret
+        return secret
         
     except (ClientError, NoCredentialsError) as e:
         # In Lambda, this should not happen if IAM is set up correctly
@@ -48,16 +151,23 @@ def is_lambda_environment():
     return os.environ.get('AWS_LAMBDA_FUNCTION_NAME') is not None
 
 
+# Resolved configuration, populated once per container by initialize_secrets()
+_config = None
+
+
 # Initialize secrets with environment-aware fallback
 def initialize_secrets():
     """Initialize secrets with proper fallback for local vs Lambda environments"""
+    global _config
+    if _config is not None:
+        return _config
     
     # Try to get secrets from AWS Secrets Manager
     secrets = get_secret()
     
     if secrets:
         print("✅ Successfully loaded secrets from AWS Secrets Manager")
-        return {
+        _config = {
             'api_url_hug': secrets.get('api_url_hug'),
             'api_url_lh': secrets.get('api_url_lh'),
             'DB_HOST': secrets.get('DB_HOST'),
@@ -69,6 +179,7 @@ def initialize_secrets():
             'KAKAO_API': secrets.get('KAKAO_API'),
             'YOUTUBE_API_KEY': secrets.get('YOUTUBE_API_KEY')
         }
+        return _config
     else:
         # Fallback values - different behavior for Lambda vs local
         if is_lambda_environment():
@@ -77,7 +188,7 @@ def initialize_secrets():
         else:
             # Local development - use environment variables as fallback
             print("⚠️  Running locally - using environment variables")
-            return {
+            _config = {
                 'api_url_hug': os.environ.get('HUG_API_URL', ''),
                 'api_url_lh': os.environ.get('LH_API_URL', ''),
                 'DB_HOST': os.environ.get('DB_HOST', ''),
@@ -89,6 +200,7 @@ def initialize_secrets():
                 'KAKAO_API': os.environ.get('KAKAO_API_KEY', ''),
                 'YOUTUBE_API_KEY': os.environ.get('YOUTUBE_API_KEY', '')
             }
+            return _config
 
 
 # Initialize all configuration variables
@@ -132,59 +244,147 @@ except Exception as e:
 #   'youtube_url': str or None
 # }
 
+# Exact-type converters for the non-JSON values pymysql returns; subclasses fall back to isinstance
+_JSON_CONVERTERS = {
+    Decimal: float,
+    datetime.date: datetime.date.isoformat,
+    datetime.datetime: datetime.datetime.isoformat,
+}
+
+
+def _convert_json_value(value):
+    convert = _JSON_CONVERTERS.get(type(value))
+    if convert is not None:
+        return convert(value)
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
+
+
 def make_json_serializable(obj):
     """
-    Recursively convert a posting object to a JSON-serializable dict.
+    Convert a posting object to a JSON-serializable dict.
     - datetime.date/datetime.datetime -> str (isoformat)
     - Decimal -> float
+    Nested dicts/lists are walked with an explicit stack instead of recursion.
     """
-    if isinstance(obj, dict):
-        return {k: make_json_serializable(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [make_json_serializable(v) for v in obj]
-    elif isinstance(obj, (datetime.date, datetime.datetime)):
-        return obj.isoformat()
-    elif isinstance(obj, Decimal):
-        return float(obj)
-    else:
-        return obj
+    if not isinstance(obj, (dict, list)):
+        return _convert_json_value(obj)
+
+    converters = _JSON_CONVERTERS
+    result = {} if isinstance(obj, dict) else []
+    stack = [(obj, result)]
+    while stack:
+        source, target = stack.pop()
+        is_dict = type(target) is dict
+        for key, value in (source.items() if is_dict else enumerate(source)):
+            value_type = type(value)
+            convert = converters.get(value_type)
+            if convert is not None:
+                value = convert(value)
+            elif value_type is dict or value_type is list or isinstance(value, (dict, list)):
+                container = {} if isinstance(value, dict) else []
+                stack.append((value, container))
+                value = container
+            else:
+                value = _convert_json_value(value)
+            if is_dict:
+                target[key] = value
+            else:
+                target.append(value)
+    return result
+
+# DNS answers are cached for the whole session (aiohttp's default is 10s) and idle
+# keep-alive connections are held long enough to be reused across batched requests
+HTTP_DNS_CACHE_TTL = 300
+HTTP_KEEPALIVE_TIMEOUT = 75
+
+
+# Creates the aiohttp session used for outbound API calls, pooling up to `limit` connections.
+def create_client_session(limit=100):
+    connector = aiohttp.TCPConnector(
+        limit=limit,
+        ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+        keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=30),
+        json_serialize=json_dumps
+    )
+
+
+# Shared requests session for the synchronous API calls, created on first use so warm
+# invocations reuse its pooled keep-alive connections instead of a new TLS handshake per call
+_http_session = None
 
-# Fetches postings from the HUG API and returns them as a list of dictionaries.
 
-def get_hug_api():
+def get_http_session():
+    """Return the shared requests.Session."""
+    global _http_session
+    if _http_session is None:
+        _http_session = requests.Session()
+        # Connection errors are retried for any method, read errors only for idempotent ones
+        # (so the Gemini POST is never sent twice)
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=3)
+        _http_session.mount('https://', adapter)
+        _http_session.mount('http://', adapter)
+    return _http_session
+
+
+# Fetches postings from the HUG API and returns them as a list of dictionaries.
+async def get_hug_api(session):
     try:
-        response = requests.get(api_url_hug, timeout=30)
-        response.raise_for_status()
-        data = response.json()
-        # TODO: Adjust this extraction logic to match the HUG API's actual structure
-        postings = data.get('response', {}).get('body', {}).get('item', [])
-        if not isinstance(postings, list):
-            postings = [postings]
-        return postings
+        async with session.get(api_url_hug) as response:
+            response.raise_for_status()
+            # Decode the raw body bytes directly; skips aiohttp's text decoding and content-type check
+            data = json_loads(await response.read())
+            # TODO: Adjust this extraction logic to match the HUG API's actual structure
+            postings = data.get('response', {}).get('body', {}).get('item', [])
+            if not isinstance(postings, list):
+                postings = [postings]
+            return postings
     except Exception as e:
         print(f"Error fetching HUG API: {e}")
         return []
 
+# The LH API only negotiates legacy ciphers, so its requests use a relaxed SSL context
+# The LH context is built once and shared; SSLContext construction is costly and the object is reusable
+@functools.lru_cache(maxsize=None)
+def get_lh_ssl_context():
+    ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    ssl_context.check_hostname = False
+    ssl_context.verify_mode = ssl.CERT_NONE
+    ssl_context.set_ciphers('DEFAULT@SECLEVEL=1')
+    return ssl_context
+
 # Asynchronously fetches postings from the LH API and returns them as a list of dictionaries.
-async def get_lh_api():
+# Pass an existing aiohttp session to share its connection pool; otherwise a one-off session is used.
+async def get_lh_api(session=None):
+    if session is None:
+        async with create_client_session() as own_session:
+            return await get_lh_api(own_session)
     try:
-        ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
-        ssl_context.check_hostname = False
-        ssl_context.verify_mode = ssl.CERT_NONE
-        ssl_context.set_ciphers('DEFAULT@SECLEVEL=1')
-        connector = aiohttp.TCPConnector(ssl=ssl_context)
-        async with aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=30)) as session:
-            async with session.get(api_url_lh) as response:
-                response.raise_for_status()
-                data = await response.json()
-                items = data.get('response', {}).get('body', {}).get('item', [])
-                if not isinstance(items, list):
-                    items = [items]
-                return items
+        async with session.get(api_url_lh, ssl=get_lh_ssl_context()) as response:
+            response.raise_for_status()
+            data = json_loads(await response.read())
+            items = data.get('response', {}).get('body', {}).get('item', [])
+            if not isinstance(items, list):
+                items = [items]
+            return items
     except Exception as e:
         print(f"Error fetching LH API: {e}")
         return []
 
+# Fetches HUG and LH postings concurrently over one pooled aiohttp session.
+# Returns a (hug_postings, lh_postings) tuple.
+async def fetch_all_postings():
+    async with create_client_session(limit=50) as session:
+        hug_postings, lh_postings = await asyncio.gather(get_hug_api(session), get_lh_api(session))
+        return hug_postings, lh_postings
+
 
 ''' db schema
 mysql> describe postings;
@@ -251,123 +451,263 @@ def extract_lh_fields(data):
 # skipping this part, using dummy instead
 
 
-# Inserts postings from a JSON file into the MySQL database (updated for new schema).
-def insert_postings_to_db(json_path):
-    with open(json_path, encoding='utf-8') as f:
-        postings = json.load(f)
+# Shared MySQL connections, kept open across warm Lambda invocations
+_db_conn = None
+_json_db_conn = None
+
+
+def get_db_connection():
+    """
+    Return the shared MySQL connection, opening it on first use and reconnecting
+    if the server dropped it while the container was idle.
+    The connection runs in autocommit mode so each query sees the latest committed data.
+    """
+    global _db_conn
+    _db_conn = _reuse_or_connect(_db_conn)
+    return _db_conn
+
+
+def get_json_db_connection():
+    """
+    Return a second shared connection whose rows come out JSON-ready: DATE/DATETIME columns
+    as ISO strings and DECIMAL columns as floats, matching make_json_serializable, so streamed
+    rows need no per-row conversion pass. Only use it for read-only SELECTs.
+    """
+    global _json_db_conn
+    _json_db_conn = _reuse_or_connect(_json_db_conn, conv=_json_ready_conversions())
+    return _json_db_conn
+
+
+# MySQL zero dates ('0000-00-00', or a zero month/day) that have no date.isoformat() equivalent
+def _is_zero_date(value):
+    return value.startswith('0000') or '-00' in value[:10]
 
-    conn = pymysql.connect(
+
+def _json_ready_conversions():
+    from pymysql.constants import FIELD_TYPE
+    conv = dict(pymysql.converters.conversions)
+    # DATE text is already date.isoformat(); DATETIME text only differs by the 'T' separator.
+    # Zero dates, which datetime can't represent, become None rather than raw strings
+    conv[FIELD_TYPE.DATE] = lambda value: None if _is_zero_date(value) else value
+    conv[FIELD_TYPE.DATETIME] = conv[FIELD_TYPE.TIMESTAMP] = (
+        lambda value: None if _is_zero_date(value) else value.replace(' ', 'T', 1)
+    )
+    conv[FIELD_TYPE.DECIMAL] = conv[FIELD_TYPE.NEWDECIMAL] = float
+    return conv
+
+
+def _reuse_or_connect(conn, **connect_args):
+    if conn is not None and conn.open:
+        try:
+            conn.ping(reconnect=True)
+            return conn
+        except pymysql.err.OperationalError as e:
+            print(f"⚠️ Shared DB connection lost, reconnecting: {e}")
+    return pymysql.connect(
         host=DB_HOST,
         port=DB_PORT,
         db=DB_NAME,
         user=DB_USER,
         password=DB_PASSWORD,
-        charset='utf8mb4'
+        charset='utf8mb4',
+        autocommit=True,
+        **connect_args
     )
 
+
+# Numeric coercion for raw API values; anything that doesn't parse becomes NULL
+def _to_int_or_none(value):
     try:
-        with conn.cursor() as cur:
-            sql = (
-                "INSERT INTO postings "
-                "(status, region_province, region_city, address_detail, apply_start, apply_end, "
-                "house_type, supply_type_id, application_url, deposit, monthly_rent, agency_id) "
-                "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)"
-            )
-            values = []
-            for p in postings:
-                val_tuple = (
-                    'Y' if p['posting_status'] == '일반공고' else 'N',
-                    p['prefecture'],
-                    p['city'],
-                    (p['detailed_address'] or '')[:20],
-                    p['application_start_date'],
-                    p['application_end_date'],
-                    p['building_type'],
-                    int(p['housing_program_type']) if p['housing_program_type'] and str(p['housing_program_type']).isdigit() else None,
-                    p['application_url'],
-                    float(p['deposit']) if p['deposit'] is not None else None,
-                    float(p['rent']) if p['rent'] is not None else None,
-                    1  # agency_id, set to 1 for LH, change as needed
-                )
-                values.append(val_tuple)
-            print("\nDB Write Query:")
-            print(sql)
-            print("Values:")
-            for v in values:
-                print(v)
-            cur.executemany(sql, values)
-        conn.commit()
-        print("All postings inserted into DB.")
-    finally:
-        conn.close()
+        return int(value)
+    except (TypeError, ValueError):
+        return None
 
 
-# Retrieves existing posting IDs from the database to avoid duplicates.
-def get_existing_posting_ids():
-    conn = pymysql.connect(
-        host=DB_HOST,
-        port=DB_PORT,
-        db=DB_NAME,
-        user=DB_USER,
-        password=DB_PASSWORD,
-        charset='utf8mb4'
-    )
+def _to_float_or_none(value):
     try:
-        with conn.cursor() as cur:
-            cur.execute("SELECT posting_id FROM postings")
-            rows = cur.fetchall()
-            return set(str(row[0]) for row in rows)
-    finally:
-        conn.close()
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+# Inserts postings from a JSON file into the MySQL database (updated for new schema).
+def insert_postings_to_db(json_path):
+    with open(json_path, encoding='utf-8') as f:
+        postings = json.load(f)
+
+    conn = get_db_connection()
+
+    with conn.cursor() as cur:
+        # Keep the statement in plain "INSERT ... VALUES (%s, ...)" form: pymysql's executemany
+        # only rewrites that shape into multi-row INSERTs (split at max_allowed_packet-safe sizes).
+        sql = (
+            "INSERT INTO postings "
+            "(status, region_province, region_city, address_detail, apply_start, apply_end, "
+            "house_type, supply_type_id, application_url, deposit, monthly_rent, agency_id) "
+            "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)"
+        )
+        values = []
+        for p in postings:
+            val_tuple = (
+                'Y' if p['posting_status'] == '일반공고' else 'N',
+                p['prefecture'],
+                p['city'],
+                (p['detailed_address'] or '')[:20],
+                p['application_start_date'],
+                p['application_end_date'],
+                p['building_type'],
+                _to_int_or_none(p['housing_program_type']),
+                p['application_url'],
+                _to_float_or_none(p['deposit']),
+                _to_float_or_none(p['rent']),
+                1  # agency_id, set to 1 for LH, change as needed
+            )
+            values.append(val_tuple)
+        cur.executemany(sql, values)
+    conn.commit()
+    print(f"All {len(values)} postings inserted into DB.")
+
+
+# Secondary indexes on postings used by the filtered detail page queries:
+# agency updates (WHERE agency_id = ... ORDER BY posting_id) and recent updates (WHERE application_end >= ...)
+POSTINGS_INDEXES = (
+    ('idx_postings_agency', 'agency_id, posting_id'),
+    ('idx_postings_application_end', 'application_end'),
+)
+
+
+# One-off migration: adds the POSTINGS_INDEXES that don't exist yet. Returns the names of the indexes created.
+def create_postings_indexes():
+    conn = get_db_connection()
+    created = []
+    with conn.cursor() as cur:
+        cur.execute(
+            "SELECT DISTINCT index_name FROM information_schema.statistics "
+            "WHERE table_schema = DATABASE() AND table_name = 'postings'"
+        )
+        existing = {row[0] for row in cur.fetchall()}
+        for index_name, columns in POSTINGS_INDEXES:
+            if index_name in existing:
+                print(f"Index {index_name} already exists on postings")
+                continue
+            cur.execute(f"ALTER TABLE postings ADD INDEX {index_name} ({columns})")
+            created.append(index_name)
+            print(f"✅ Added index {index_name} ({columns}) on postings")
+    return created
+
+
+# Retrieves which of the candidate posting IDs already exist in the database to avoid duplicates.
+# Only the candidates are looked up (in IN-list batches), not the whole postings table.
+def get_existing_posting_ids(candidate_ids, batch_size=1000):
+    candidate_ids = list({str(posting_id) for posting_id in candidate_ids if posting_id is not None})
+    existing_ids = set()
+    if not candidate_ids:
+        return existing_ids
+
+    conn = get_db_connection()
+    # Unbuffered cursor: rows are streamed into the set instead of materialized by fetchall()
+    with conn.cursor(pymysql.cursors.SSCursor) as cur:
+        for start in range(0, len(candidate_ids), batch_size):
+            batch = candidate_ids[start:start + batch_size]
+            placeholders = ', '.join(['%s'] * len(batch))
+            cur.execute(f"SELECT posting_id FROM postings WHERE posting_id IN ({placeholders})", batch)
+            existing_ids.update(str(row[0]) for row in cur)
+    return existing_ids
 
 
 # Filters out postings that already exist in the database based on posting_id.
 def filter_new_postings(postings):
-    existing_ids = get_existing_posting_ids()
+    existing_ids = get_existing_posting_ids(p.get('posting_id') for p in postings)
     # Use 'posting_id' as the unique key in your posting object
     new_postings = [p for p in postings if str(p.get('posting_id')) not in existing_ids]
     return new_postings
 
 
-# send new posting object to gemini api and get one sentence summary, return object with summary
-def get_ai_summary_for_posting(posting):
-    
-    GEMINI_API_URL = "https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash:generateContent"
-    GEMINI_API_KEY = GEMINI_API_KEY_PLAINTEXT
-    # Compose prompt
-    prompt = f"""
-    다음은 한국 공공임대주택 공고 데이터입니다. 이 정보를 바탕으로 이 공고의 특별하거나 차별된 점을 60글자 이내 한문장, 입니다체로 요약해 주세요 :\n{json.dumps(posting, ensure_ascii=False)}
+GEMINI_API_URL = "https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash:generateContent"
+
+# Maximum number of Gemini requests in flight when summarizing a batch of postings
+GEMINI_CONCURRENCY = 16
+
+# Static parts of every Gemini request; only the posting JSON changes between calls
+_GEMINI_HEADERS = {"Content-Type": "application/json"}
+_GEMINI_PARAMS = {"key": GEMINI_API_KEY_PLAINTEXT}
+_GEMINI_PROMPT_PREFIX = """
+    다음은 한국 공공임대주택 공고 데이터입니다. 이 정보를 바탕으로 이 공고의 특별하거나 차별된 점을 60글자 이내 한문장, 입니다체로 요약해 주세요 :\n"""
+_GEMINI_PROMPT_SUFFIX = """
     """
-    payload = {
+
+
+# Builds the Gemini generateContent payload asking for a one sentence summary of the posting.
+def build_ai_summary_payload(posting):
+    prompt = _GEMINI_PROMPT_PREFIX + json_dumps(posting) + _GEMINI_PROMPT_SUFFIX
+    return {
         "contents": [{
             "parts": [{"text": prompt}]
         }]
     }
-    headers = {"Content-Type": "application/json"}
-    params = {"key": GEMINI_API_KEY}
+
+
+# Pulls the summary text out of a Gemini generateContent response.
+def extract_ai_summary(data):
+    return data.get('candidates', [{}])[0].get('content', {}).get('parts', [{}])[0].get('text', '').strip()
+
+
+# send new posting object to gemini api and get one sentence summary, return object with summary
+def get_ai_summary_for_posting(posting):
+    payload = build_ai_summary_payload(posting)
     try:
-        response = requests.post(GEMINI_API_URL, params=params, headers=headers, json=payload, timeout=30)
+        response = get_http_session().post(GEMINI_API_URL, params=_GEMINI_PARAMS, headers=_GEMINI_HEADERS, json=payload, timeout=30)
         response.raise_for_status()
-        data = response.json()
-        summary = data.get('candidates', [{}])[0].get('content', {}).get('parts', [{}])[0].get('text', '').strip()
-        posting['summary'] = summary
+        data = json_loads(response.content)
+        posting['summary'] = extract_ai_summary(data)
+    except Exception as e:
+        posting['summary'] = f"[AI 요약 실패: {e}]"
+    return posting
+
+
+# Async variant of get_ai_summary_for_posting that reuses the caller's aiohttp session.
+async def get_ai_summary_for_posting_async(session, posting):
+    payload = build_ai_summary_payload(posting)
+    try:
+        async with session.post(GEMINI_API_URL, params=_GEMINI_PARAMS, json=payload) as response:
+            response.raise_for_status()
+            data = json_loads(await response.read())
+            posting['summary'] = extract_ai_summary(data)
     except Exception as e:
         posting['summary'] = f"[AI 요약 실패: {e}]"
     return posting
 
 
+# Summarizes many postings over one aiohttp session using a fixed pool of `concurrency` workers
+# draining a queue, so only that many tasks exist no matter how large the batch is.
+async def get_ai_summaries_for_postings_async(postings, concurrency=GEMINI_CONCURRENCY):
+    queue = asyncio.Queue()
+    for posting in postings:
+        queue.put_nowait(posting)
+
+    async with create_client_session(limit=concurrency) as session:
+        async def worker():
+            while not queue.empty():
+                posting = queue.get_nowait()
+                await get_ai_summary_for_posting_async(session, posting)
+
+        await asyncio.gather(*(worker() for _ in range(min(concurrency, len(postings)))))
+    # Summaries are written into the posting dicts in place, so input order is preserved
+    return postings
+
+
+# Synchronous entry point for the workflows: returns the postings (in order) with 'summary' filled in.
+def get_ai_summaries_for_postings(postings, concurrency=GEMINI_CONCURRENCY):
+    if not postings:
+        return []
+    return list(asyncio.run(get_ai_summaries_for_postings_async(postings, concurrency)))
+
+
 # read from rds postings with shorts url, get newest posting
 def get_newest_posting_without_video():
     print("Connecting to the database...")
-    conn = pymysql.connect(
-        host=DB_HOST,
-        port=DB_PORT,
-        db=DB_NAME,
-        user=DB_USER,
-        password=DB_PASSWORD,
-        charset='utf8mb4'
-    )
     try:
+        conn = get_db_connection()
         print("Connected to the database. Executing query...")
         with conn.cursor() as cur:
             sql = (
@@ -387,207 +727,148 @@ def get_newest_posting_without_video():
     except Exception as e:
         print(f"An error occurred: {e}")
         return None
-    finally:
-        print("Closing the database connection...")
-        conn.close()
-        print("Database connection closed.")
 
 
-# Generates a detail page HTML string for a given posting object, using the same format as housing-1.html.
-# If some data (like video url) are missing, it will display a placeholder message.
-def generate_detail_page_html(posting, posting_types, save_local=True, save_s3=True, s3_bucket='wepl-posting-pages', s3_folder=None):
-    """
-    Generates a detail page HTML string for a given posting object, using the same format as housing-1.html.
-    If some data (like video url) are missing, it will display a placeholder message.
-    Also saves the HTML locally and to AWS S3 with the format {agency_id}-{posting_id}.html.
-    """
-    # Initialize main_content to hold the HTML content
-    main_content = ""
+# Maximum number of concurrent S3 uploads; the shared client's connection pool is sized to match
+S3_UPLOAD_WORKERS = int(os.environ.get('DETAIL_WORKERS', 32))
+# Rendered pages allowed to wait for an upload slot before rendering pauses
+MAX_PENDING_UPLOADS = 4 * S3_UPLOAD_WORKERS
 
-    # Price formatting helper function
-    def format_price(price_value):
-        """Format price to 억/만원 units, or 없음 if 0"""
-        if price_value is None or price_value == 0 or price_value == "0" or price_value == "0.0":
-            return "없음"
-        try:
-            # Convert to float if it's a string
-            if isinstance(price_value, str):
-                price_float = float(price_value)
-            else:
-                price_float = float(price_value)
-            
-            if price_float >= 100_000_000:  # 1억 이상
-                eok_decimal = price_float / 100_000_000
-                return f"{eok_decimal:.1f}억원"
-            else:  # 1억 미만
-                man = int(round(price_float / 10_000))
-                return f"{man:,}만원"
-        except (ValueError, TypeError):
-            return "없음"
+# Cache-Control for objects served through CloudFront. Detail pages are re-rendered in place
+# (status, video), so they get a bounded TTL; index.html changes on every sync and stays short.
+DETAIL_PAGE_CACHE_CONTROL = 'public, max-age=3600, stale-while-revalidate=86400'
+INDEX_PAGE_CACHE_CONTROL = 'public, max-age=60, stale-while-revalidate=300'
+INDEX_PAGE_UPLOAD_ARGS = {'ContentType': 'text/html; charset=utf-8', 'CacheControl': INDEX_PAGE_CACHE_CONTROL}
 
-    # Helper for safe value
-    def safe(val, default="-"):
-        return val if val not in (None, "") else default
+# S3 object metadata key holding the SHA-256 of the uncompressed index page
+INDEX_HASH_METADATA_KEY = 'content-sha256'
 
-    # Color scheme functions matching the JavaScript file exactly
-    def get_supply_type_color(type_id):
-        """Get consistent color scheme for supply type badges - matches JavaScript getSupplyTypeColor function"""
-        try:
-            type_id = int(type_id) if type_id else 1
-        except (ValueError, TypeError):
-            type_id = 1
-            
-        # These colors match exactly with the JavaScript getSupplyTypeColor function
-        colors = {
-            1: "bg-gray-100 text-gray-800 border-gray-300",      # 일반공급
-            2: "bg-blue-100 text-blue-800 border-blue-300",      # 청년우선공급
-            3: "bg-rose-100 text-rose-800 border-rose-300",      # 신혼부부우선공급
-            4: "bg-orange-100 text-orange-800 border-orange-300", # 다자녀우선공급
-            5: "bg-yellow-100 text-yellow-800 border-yellow-300", # 행복주택
-            6: "bg-pink-100 text-pink-800 border-pink-300",      # 신혼신생아 전세임대
-            7: "bg-amber-100 text-amber-800 border-amber-400"    # 든든전세
-        }
-        return colors.get(type_id, "bg-gray-100 text-gray-800 border-gray-300")
-
-    def get_house_type_color(house_type):
-        """Get consistent color scheme for house type badges - matches JavaScript getHouseTypeColor function"""
-        # These colors match exactly with the JavaScript getHouseTypeColor function
-        colors = {
-            "아파트": "bg-sky-100 text-sky-800 border-sky-300",
-            "연립주택": "bg-amber-100 text-amber-800 border-amber-300", 
-            "다가구주택": "bg-lime-100 text-lime-800 border-lime-300",
-            "단독주택": "bg-stone-100 text-stone-800 border-stone-300",
-            "오피스텔(주거용)": "bg-purple-100 text-purple-800 border-purple-300",
-            "다세대주택": "bg-lime-100 text-lime-800 border-lime-300"
-        }
-        return colors.get(house_type, "bg-gray-100 text-gray-800 border-gray-300")
+# gzip level for uploaded HTML: close to level 9's ratio on markup at a fraction of the CPU
+HTML_GZIP_LEVEL = 6
 
-    def get_status_info(apply_start, apply_end):
-        """Get status info based on dates - matches JavaScript getStatusInfo function"""
-        from datetime import datetime
-        
-        try:
-            today = datetime.now().date()
-            start_date = datetime.strptime(apply_start, '%Y-%m-%d').date() if apply_start and apply_start != "-" else None
-            end_date = datetime.strptime(apply_end, '%Y-%m-%d').date() if apply_end and apply_end != "-" else None
-            
-            if start_date and end_date:
-                if today < start_date:
-                    # Before application start - 공고중 (light green)
-                    return {
-                        "status": "공고중",
-                        "color": "bg-green-50 text-green-700 border-green-400"
-                    }
-                elif start_date <= today <= end_date:
-                    # Within application period - 접수중 (bright green)
-                    return {
-                        "status": "접수중", 
-                        "color": "bg-green-200 text-green-900 border-green-800"
-                    }
-                else:
-                    # After application end - 종료 (red)
-                    return {
-                        "status": "종료",
-                        "color": "bg-red-100 text-red-800 border-red-300"
-                    }
-            else:
-                # Default status when dates are not available
-                return {
-                    "status": "공고중",
-                    "color": "bg-green-50 text-green-700 border-green-400"
-                }
-        except (ValueError, TypeError):
-            # Fallback for invalid dates
-            return {
-                "status": "공고중", 
-                "color": "bg-green-50 text-green-700 border-green-400"
-            }
+# Shared S3 client, created on first use and reused across uploads and warm invocations
+_s3_client = None
 
-    # Legacy function for backward compatibility - now uses getStatusInfo
-    def get_status_color(status):
-        """Legacy function - kept for compatibility"""
-        return "bg-green-100 text-green-800 border-green-300" if status == "Y" else "bg-red-100 text-red-800 border-red-300"
 
-    # Fetch posting type details
-    posting_type_id = posting.get("posting_type_id")
-    posting_type_details = posting_types.get(posting_type_id, {})
+def get_s3_client():
+    """Return the shared S3 client (boto3 clients are thread-safe)."""
+    global _s3_client
+    if _s3_client is None:
+        _s3_client = boto3.client(
+            's3',
+            config=Config(
+                max_pool_connections=S3_UPLOAD_WORKERS,
+                tcp_keepalive=True,
+                retries={'max_attempts': 10, 'mode': 'adaptive'}
+            )
+        )
+    return _s3_client
+
+
+# Badge color schemes - these match exactly with the JavaScript getSupplyTypeColor / getHouseTypeColor functions
+_DEFAULT_BADGE_COLOR = "bg-gray-100 text-gray-800 border-gray-300"
+
+_SUPPLY_COLORS = {
+    1: "bg-gray-100 text-gray-800 border-gray-300",      # 일반공급
+    2: "bg-blue-100 text-blue-800 border-blue-300",      # 청년우선공급
+    3: "bg-rose-100 text-rose-800 border-rose-300",      # 신혼부부우선공급
+    4: "bg-orange-100 text-orange-800 border-orange-300", # 다자녀우선공급
+    5: "bg-yellow-100 text-yellow-800 border-yellow-300", # 행복주택
+    6: "bg-pink-100 text-pink-800 border-pink-300",      # 신혼신생아 전세임대
+    7: "bg-amber-100 text-amber-800 border-amber-400"    # 든든전세
+}
+
+_HOUSE_COLORS = {
+    "아파트": "bg-sky-100 text-sky-800 border-sky-300",
+    "연립주택": "bg-amber-100 text-amber-800 border-amber-300", 
+    "다가구주택": "bg-lime-100 text-lime-800 border-lime-300",
+    "단독주택": "bg-stone-100 text-stone-800 border-stone-300",
+    "오피스텔(주거용)": "bg-purple-100 text-purple-800 border-purple-300",
+    "다세대주택": "bg-lime-100 text-lime-800 border-lime-300"
+}
+
+
+def get_supply_type_color(type_id):
+    """Get consistent color scheme for supply type badges - matches JavaScript getSupplyTypeColor function"""
+    try:
+        type_id = int(type_id) if type_id else 1
+    except (ValueError, TypeError):
+        type_id = 1
+    return _SUPPLY_COLORS.get(type_id, _DEFAULT_BADGE_COLOR)
 
-    # Debugging: Print posting_type_id and fetched posting_type_details
-    print("Posting Type ID:", posting_type_id)
-    print("Fetched Posting Type Details:", posting_type_details)
 
-    # Ensure posting_type_id is correctly matched
-    if not posting_type_details:
-        print(f"No matching posting type found for posting_type_id: {posting_type_id}")
+def get_house_type_color(house_type):
+    """Get consistent color scheme for house type badges - matches JavaScript getHouseTypeColor function"""
+    return _HOUSE_COLORS.get(house_type, _DEFAULT_BADGE_COLOR)
 
-    # Correctly fetch limits from posting_type_details and format them
-    income_limit = format_price(posting_type_details.get('salary_limit')) if posting_type_details.get('salary_limit') else '정보 없음'
-    asset_limit = format_price(posting_type_details.get('asset_limit')) if posting_type_details.get('asset_limit') else '정보 없음'
-    vehicle_limit = format_price(posting_type_details.get('vehicle_limit')) if posting_type_details.get('vehicle_limit') else '정보 없음'
 
-    # Define application_status variable
-    application_status = safe(posting.get('application_status'), '정보 없음')
+# Korean price units
+_EOK = 100_000_000  # 1억
+_MAN = 10_000  # 1만
 
-    # Debugging: Print the correctly fetched values
-    print("Correct values from posting_type_details:")
-    print("Income Limit:", income_limit)
-    print("Asset Limit:", asset_limit)
-    print("Vehicle Limit:", vehicle_limit)
 
-    # Video URL logic - Updated for proper 16:9 aspect ratio and shorter card when no video
-    video_url = posting.get('youtube_url')
-    if video_url:
-        video_embed = f'''<div class="relative w-full" style="aspect-ratio: 16/9;">
-            <iframe class="absolute inset-0 w-full h-full rounded-lg" src="{video_url}" title="YouTube video player" frameborder="0" allow="accelerometer; autoplay; clipboard-write; encrypted-media; gyroscope; picture-in-picture; web-share" allowfullscreen></iframe>
-        </div>'''
-        video_card_padding = "p-4 pt-0"
-    else:
-        video_embed = '<div class="flex items-center justify-center w-full h-24 text-gray-400 text-lg bg-gray-50 rounded-lg border-2 border-dashed border-gray-300">영상이 곧 제공될 예정입니다.</div>'
-        video_card_padding = "p-4 pt-0"
-    
-    # AI summary logic
-    ai_summary = posting.get('ai_summary') or 'AI 요약이 곧 제공될 예정입니다.'
-    # Agency name
-    agency_name = safe(posting.get('agency_id'), '기관 정보 없음')
-    # Application URL
-    application_url = safe(posting.get('application_url'), '#')
-    # Dates
-    apply_start = safe(posting.get('application_start'))
-    apply_end = safe(posting.get('application_end'))
-    # Price
-    deposit = format_price(posting.get('deposit'))
-    rent = format_price(posting.get('rent'))
-    # Address
-    area_province = safe(posting.get('area_province'))
-    area_city = safe(posting.get('area_city'))
-    address = safe(posting.get('address'))
-    # Types
-    building_type = safe(posting.get('building_type'))
-    # Summary
-    summary = safe(posting.get('summary'))
-    if not summary:
-        summary = posting.get('ai_summary')
-    if not summary:
-        summary = '요약 정보가 곧 제공될 예정입니다.'
-    # Posting ID
-    posting_id = safe(posting.get('posting_id'))
-    # Posting type details
-    posting_type_name = safe(posting_type_details.get('type_name'), 'Unknown Type')
+# Prices repeat heavily across postings (deposits, rents, posting type limits), so results are cached
+@functools.lru_cache(maxsize=8192)
+def format_price(price_value):
+    """Format price to 억/만원 units, or 없음 if 0"""
+    if price_value is None or price_value == 0 or price_value == "0" or price_value == "0.0":
+        return "없음"
+    try:
+        price_float = float(price_value)
+        if price_float >= _EOK:  # 1억 이상
+            return format(price_float / _EOK, '.1f') + "억원"
+        else:  # 1억 미만
+            return format(int(round(price_float / _MAN)), ',') + "만원"
+    except (ValueError, TypeError):
+        return "없음"
 
-    # Get color schemes using the updated functions that match JavaScript
-    supply_type_color = get_supply_type_color(posting_type_id)
-    house_type_color = get_house_type_color(building_type)
-    
-    # Get status info using the new function that matches JavaScript
-    status_info = get_status_info(apply_start, apply_end)
-    status = status_info["status"]
-    status_color = status_info["color"]
 
-    # make a full address for geocoding
-    fullAddress = f"{area_province} {area_city} {address}".strip()
+@functools.lru_cache(maxsize=4096)
+def get_status_info(apply_start, apply_end, today):
+    """
+    Get status info based on dates - matches JavaScript getStatusInfo function.
+    Memoized on (apply_start, apply_end, today); the returned dict is shared and must not be mutated.
+    """
+    try:
+        start_date = datetime.date.fromisoformat(apply_start) if apply_start and apply_start != "-" else None
+        end_date = datetime.date.fromisoformat(apply_end) if apply_end and apply_end != "-" else None
+        
+        if start_date and end_date:
+            if today < start_date:
+                # Before application start - 공고중 (light green)
+                return {
+                    "status": "공고중",
+                    "color": "bg-green-50 text-green-700 border-green-400"
+                }
+            elif start_date <= today <= end_date:
+                # Within application period - 접수중 (bright green)
+                return {
+                    "status": "접수중", 
+                    "color": "bg-green-200 text-green-900 border-green-800"
+                }
+            else:
+                # After application end - 종료 (red)
+                return {
+                    "status": "종료",
+                    "color": "bg-red-100 text-red-800 border-red-300"
+                }
+        else:
+            # Default status when dates are not available
+            return {
+                "status": "공고중",
+                "color": "bg-green-50 text-green-700 border-green-400"
+            }
+    except (ValueError, TypeError):
+        # Fallback for invalid dates
+        return {
+            "status": "공고중", 
+            "color": "bg-green-50 text-green-700 border-green-400"
+        }
 
-    # HTML
-    html = f'''<!DOCTYPE html>
+
+# Detail page HTML in str.format syntax, compiled once at import (see compile_format_template).
+# Literal braces in the embedded CSS/JS are doubled ({{ }}) as in str.format.
+DETAIL_PAGE_TEMPLATE = '''<!DOCTYPE html>
 <html lang="ko">
 <head>
     <meta charset="UTF-8">
@@ -813,13 +1094,15 @@ def generate_detail_page_html(posting, posting_types, save_local=True, save_s3=T
 
     <script src="script.js"></script>
     <script>
+        // Application period as epoch milliseconds, rendered server-side (NaN when unknown)
+        const APPLY_START_MS = {apply_start_ms};
+        const APPLY_END_MS = {apply_end_ms};
+
         // Update application status based on current date using the same logic as the main site
         function updateApplicationStatus() {{
-            const today = new Date();
-            const applicationStart = new Date('{apply_start}');
-            const applicationEnd = new Date('{apply_end}');
+            const now = Date.now();
             
-            let statusInfo = getStatusInfo('{apply_start}', '{apply_end}');
+            let statusInfo = getStatusInfo(APPLY_START_MS, APPLY_END_MS, now);
             
             // Update all status badges
             const statusBadges = ['status-badge', 'status-badge-2', 'status-badge-3'];
@@ -836,10 +1119,10 @@ def generate_detail_page_html(posting, posting_types, save_local=True, save_s3=T
             if (appStatusElement) {{
                 let appStatusText = '';
                 let appStatusColor = '';
-                if (today < new Date('{apply_start}')) {{
+                if (now < APPLY_START_MS) {{
                     appStatusText = '신청 접수 예정';
                     appStatusColor = 'text-gray-600';
-                }} else if (today >= new Date('{apply_start}') && today <= new Date('{apply_end}')) {{
+                }} else if (now >= APPLY_START_MS && now <= APPLY_END_MS) {{
                     appStatusText = '현재 신청 접수 중';
                     appStatusColor = 'text-green-600';
                 }} else {{
@@ -851,18 +1134,14 @@ def generate_detail_page_html(posting, posting_types, save_local=True, save_s3=T
             }}
         }}
         
-        // Use the same getStatusInfo function from script.js
-        function getStatusInfo(applyStart, applyEnd) {{
-            const today = new Date();
-            const startDate = new Date(applyStart);
-            const endDate = new Date(applyEnd);
-            
-            if (today < startDate) {{
+        // Same rules as getStatusInfo in script.js, on epoch milliseconds
+        function getStatusInfo(startMs, endMs, now) {{
+            if (now < startMs) {{
                 return {{
                     status: "공고중",
                     color: "bg-green-50 text-green-700 border-green-400"
                 }};
-            }} else if (today >= startDate && today <= endDate) {{
+            }} else if (now >= startMs && now <= endMs) {{
                 return {{
                     status: "접수중", 
                     color: "bg-green-200 text-green-900 border-green-800"
@@ -891,27 +1170,221 @@ def generate_detail_page_html(posting, posting_types, save_local=True, save_s3=T
     </script>
 </body>
 </html>'''
+
+
+def compile_format_template(template):
+    """
+    Pre-parse a str.format template into (literal_bytes, field_name) pairs so rendering
+    doesn't rescan the whole template on every call. The static chunks are encoded to UTF-8
+    once here, so only the field values are encoded per render. Only bare {name} fields are supported.
+    """
+    parts = []
+    for literal, field_name, format_spec, conversion in string.Formatter().parse(template):
+        if format_spec or conversion:
+            raise ValueError(f"Unsupported template field: {field_name}")
+        parts.append((literal.encode('utf-8'), field_name))
+    return tuple(parts)
+
+
+def render_compiled_template(parts, values):
+    """Fill a template compiled by compile_format_template; same output as template.format_map(values).encode('utf-8')."""
+    chunks = []
+    append = chunks.append
+    for literal, field_name in parts:
+        append(literal)
+        if field_name is not None:
+            append(str(values[field_name]).encode('utf-8'))
+    return b''.join(chunks)
+
+
+_DETAIL_PAGE_PARTS = compile_format_template(DETAIL_PAGE_TEMPLATE)
+
+
+def iso_date_to_epoch_ms(value):
+    """
+    Converts an ISO date string to epoch milliseconds for the detail page's status script.
+    A bare date is UTC midnight, as in JS `new Date(value)`; a date-time without an offset is
+    also read as UTC (JS would use the viewer's local time, which isn't known at render time).
+    Returns "NaN" for missing/unparsable values, including non-ISO forms like YYYYMMDD, so the
+    rendered JS comparisons behave like they did on an Invalid Date.
+    """
+    text = str(value).strip()
+    # Newer Pythons' fromisoformat also reads compact forms like YYYYMMDD, which JS rejects
+    if text[4:5] != '-':
+        return "NaN"
+    if text.endswith('Z'):
+        text = text[:-1] + '+00:00'
+    try:
+        parsed = datetime.datetime.fromisoformat(text)
+    except ValueError:
+        # Python 3.9's fromisoformat only reads what isoformat() writes; fall back to the
+        # YYYY-MM-DD date part at UTC midnight
+        try:
+            parsed = datetime.datetime.combine(datetime.date.fromisoformat(text[:10]), datetime.time())
+        except ValueError:
+            return "NaN"
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+    return int(parsed.timestamp() * 1000)
+
+# Posting fields that come from the DB / APIs as free text and land in HTML text or attributes
+_DETAIL_PAGE_ESCAPED_FIELDS = (
+    'area_province', 'area_city', 'building_type', 'posting_type_name', 'summary',
+    'posting_id', 'address', 'agency_name', 'application_url'
+)
+
+
+def escape_template_values(values, fields=_DETAIL_PAGE_ESCAPED_FIELDS):
+    """HTML-escapes the given fields of a template values dict in place (one pass per field)."""
+    for field_name in fields:
+        values[field_name] = html_escape(str(values[field_name]), quote=True)
+    return values
+
+
+# Generates a detail page HTML string for a given posting object, using the same format as housing-1.html.
+# If some data (like video url) are missing, it will display a placeholder message.
+# posting_type columns generate_detail_page_html reads, and the postings query that joins them in
+POSTING_TYPE_DETAIL_COLUMNS = ('type_name', 'salary_limit', 'asset_limit', 'vehicle_limit')
+DETAIL_POSTINGS_SELECT = """
+    SELECT p.*, pt.type_name, pt.salary_limit, pt.asset_limit, pt.vehicle_limit
+    FROM postings p
+    LEFT JOIN posting_type pt ON pt.posting_type_id = p.posting_type_id
+"""
+DETAIL_POSTINGS_SQL = DETAIL_POSTINGS_SELECT + "    ORDER BY p.posting_id DESC\n"
+
+
+def generate_detail_page_html(posting, posting_types, save_local=True, save_s3=True, s3_bucket='wepl-posting-pages', s3_folder=None):
+    """
+    Generates the detail page HTML (UTF-8 bytes) for a given posting object, using the same format as housing-1.html.
+    posting_types may be None when the posting row already carries the posting_type columns
+    (see POSTING_TYPE_DETAIL_COLUMNS), e.g. rows from DETAIL_POSTINGS_SQL.
+    If some data (like video url) are missing, it will display a placeholder message.
+    Also saves the HTML locally and to AWS S3 with the format {agency_id}-{posting_id}.html.
+    """
+    # Initialize main_content to hold the HTML content
+    main_content = ""
+
+    # Helper for safe value
+    def safe(val, default="-"):
+        return val if val not in (None, "") else default
+
+    # Legacy function for backward compatibility - now uses getStatusInfo
+    def get_status_color(status):
+        """Legacy function - kept for compatibility"""
+        return "bg-green-100 text-green-800 border-green-300" if status == "Y" else "bg-red-100 text-red-800 border-red-300"
+
+    # Fetch posting type details (from the posting's own joined posting_type columns when posting_types is None)
+    posting_type_id = posting.get("posting_type_id")
+    if posting_types is None:
+        posting_type_details = {column: posting.get(column) for column in POSTING_TYPE_DETAIL_COLUMNS}
+        if posting_type_details['type_name'] is None:
+            posting_type_details = {}
+    else:
+        posting_type_details = posting_types.get(posting_type_id, {})
+
+    # Ensure posting_type_id is correctly matched
+    if not posting_type_details:
+        print(f"No matching posting type found for posting_type_id: {posting_type_id}")
+
+    # Correctly fetch limits from posting_type_details and format them
+    income_limit = format_price(posting_type_details.get('salary_limit')) if posting_type_details.get('salary_limit') else '정보 없음'
+    asset_limit = format_price(posting_type_details.get('asset_limit')) if posting_type_details.get('asset_limit') else '정보 없음'
+    vehicle_limit = format_price(posting_type_details.get('vehicle_limit')) if posting_type_details.get('vehicle_limit') else '정보 없음'
+
+    # Define application_status variable
+    application_status = safe(posting.get('application_status'), '정보 없음')
+
+    # Video URL logic - Updated for proper 16:9 aspect ratio and shorter card when no video
+    video_url = posting.get('youtube_url')
+    if video_url:
+        video_embed = f'''<div class="relative w-full" style="aspect-ratio: 16/9;">
+            <iframe class="absolute inset-0 w-full h-full rounded-lg" src="{video_url}" title="YouTube video player" frameborder="0" allow="accelerometer; autoplay; clipboard-write; encrypted-media; gyroscope; picture-in-picture; web-share" allowfullscreen></iframe>
+        </div>'''
+        video_card_padding = "p-4 pt-0"
+    else:
+        video_embed = '<div class="flex items-center justify-center w-full h-24 text-gray-400 text-lg bg-gray-50 rounded-lg border-2 border-dashed border-gray-300">영상이 곧 제공될 예정입니다.</div>'
+        video_card_padding = "p-4 pt-0"
+    
+    # AI summary logic
+    ai_summary = posting.get('ai_summary') or 'AI 요약이 곧 제공될 예정입니다.'
+    # Agency name
+    agency_name = safe(posting.get('agency_id'), '기관 정보 없음')
+    # Application URL
+    application_url = safe(posting.get('application_url'), '#')
+    # Dates
+    apply_start = safe(posting.get('application_start'))
+    apply_end = safe(posting.get('application_end'))
+    # Price
+    deposit = format_price(posting.get('deposit'))
+    rent = format_price(posting.get('rent'))
+    # Address
+    area_province = safe(posting.get('area_province'))
+    area_city = safe(posting.get('area_city'))
+    address = safe(posting.get('address'))
+    # Types
+    building_type = safe(posting.get('building_type'))
+    # Summary
+    summary = safe(posting.get('summary'))
+    if not summary:
+        summary = posting.get('ai_summary')
+    if not summary:
+        summary = '요약 정보가 곧 제공될 예정입니다.'
+    # Posting ID
+    posting_id = safe(posting.get('posting_id'))
+    # Posting type details
+    posting_type_name = safe(posting_type_details.get('type_name'), 'Unknown Type')
+
+    # Get color schemes using the updated functions that match JavaScript
+    supply_type_color = get_supply_type_color(posting_type_id)
+    house_type_color = get_house_type_color(building_type)
+    
+    # Get status info using the new function that matches JavaScript
+    status_info = get_status_info(apply_start, apply_end, datetime.date.today())
+    status = status_info["status"]
+    status_color = status_info["color"]
+
+    # make a full address for geocoding
+    fullAddress = f"{area_province} {area_city} {address}".strip()
+
+    # HTML
+    html = render_compiled_template(_DETAIL_PAGE_PARTS, escape_template_values({
+        'area_province': area_province,
+        'area_city': area_city,
+        'building_type': building_type,
+        'KAKAO_API': KAKAO_API,
+        'status_color': status_color,
+        'status': status,
+        'supply_type_color': supply_type_color,
+        'posting_type_name': posting_type_name,
+        'house_type_color': house_type_color,
+        'summary': summary,
+        'posting_id': posting_id,
+        'address': address,
+        'apply_start': apply_start,
+        'apply_end': apply_end,
+        'apply_start_ms': iso_date_to_epoch_ms(apply_start),
+        'apply_end_ms': iso_date_to_epoch_ms(apply_end),
+        'agency_name': agency_name,
+        'video_card_padding': video_card_padding,
+        'video_embed': video_embed,
+        'income_limit': income_limit,
+        'asset_limit': asset_limit,
+        'vehicle_limit': vehicle_limit,
+        'application_url': application_url,
+        'deposit': deposit,
+        'rent': rent
+    }))
     
     # Save locally
     filename = f"{agency_name}-{posting_id}.html"
     if save_local:
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write(html)
+        write_bytes_file(filename, html)
     
     # Save to S3
     if save_s3:
         try:
-            s3 = boto3.client('s3')
             s3_key = f"{s3_folder}/{filename}" if s3_folder else filename
-            
-            # Upload HTML content directly to S3
-            s3.put_object(
-                Bucket=s3_bucket,
-                Key=s3_key,
-                Body=html.encode('utf-8'),
-                ContentType='text/html; charset=utf-8',
-                ContentEncoding='utf-8'
-            )
+            upload_html_to_s3(s3_bucket, s3_key, html)
             print(f"Uploaded detail page {filename} to S3 bucket {s3_bucket}/{s3_key}")
         except Exception as e:
             print(f"Error uploading detail page to S3: {e}")
@@ -919,6 +1392,130 @@ def generate_detail_page_html(posting, posting_types, save_local=True, save_s3=T
     return html
 
 
+# Writes already-encoded bytes straight to a file descriptor, skipping the buffered file object.
+def write_bytes_file(path, data):
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        with memoryview(data) as view:
+            while view:
+                view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+# Returns the detail page file name / S3 key for a posting: {agency_id}-{posting_id}.html
+# (same defaults generate_detail_page_html applies to missing values).
+def get_detail_page_filename(posting, s3_folder=None):
+    agency_id = posting.get('agency_id')
+    posting_id = posting.get('posting_id')
+    agency_name = agency_id if agency_id not in (None, "") else '기관 정보 없음'
+    filename = f"{agency_name}-{posting_id if posting_id not in (None, '') else '-'}.html"
+    return f"{s3_folder}/{filename}" if s3_folder else filename
+
+
+# Uploads one rendered HTML document (UTF-8 bytes) to S3 over the shared client. Raises on failure.
+# The body is stored gzip-compressed; S3 serves it with Content-Encoding: gzip so browsers inflate it.
+# The gzip header carries no timestamp, so the same page always compresses to the same bytes and
+# the object's ETag (the MD5 of a single-part upload) identifies its content. When the caller
+# passes the current ETag and it matches, the PUT is skipped. Returns False if skipped.
+# The ETag only covers the body: after changing the upload headers (e.g. DETAIL_PAGE_CACHE_CONTROL)
+# pages must be re-uploaded without the ETag (generate_all with force_upload) to pick them up.
+def upload_html_to_s3(s3_bucket, s3_key, html, etag=None):
+    body = gzip.compress(html, compresslevel=HTML_GZIP_LEVEL, mtime=0)
+    if etag is not None and etag == f'"{hashlib.md5(body, usedforsecurity=False).hexdigest()}"':
+        return False
+    get_s3_client().put_object(
+        Bucket=s3_bucket,
+        Key=s3_key,
+        Body=body,
+        ContentType='text/html; charset=utf-8',
+        ContentEncoding='gzip',
+        CacheControl=DETAIL_PAGE_CACHE_CONTROL
+    )
+    return True
+
+
+# Returns {key: ETag} for the objects in the bucket under prefix (1000 keys per list request).
+def list_object_etags(s3_bucket, prefix=''):
+    etags = {}
+    paginator = get_s3_client().get_paginator('list_objects_v2')
+    for page in paginator.paginate(Bucket=s3_bucket, Prefix=prefix):
+        for obj in page.get('Contents', ()):
+            etags[obj['Key']] = obj['ETag']
+    return etags
+
+
+# Uploads the index page to the main page bucket, gzip-compressed like the detail pages.
+# The body is read from html_file_path unless the page is passed in as html_bytes.
+# The SHA-256 of the page is stored as object metadata; when the object in S3 already has the
+# same hash the PUT is skipped. Returns False if the upload was skipped.
+def upload_index_html_to_s3(html_file_path, s3_bucket='wepl-mainpage', html_bytes=None):
+    if html_bytes is None:
+        with open(html_file_path, 'rb') as f:
+            html_bytes = f.read()
+    s3_key = os.path.basename(html_file_path)
+    content_hash = hashlib.sha256(html_bytes).hexdigest()
+    s3 = get_s3_client()
+    try:
+        previous_hash = s3.head_object(Bucket=s3_bucket, Key=s3_key).get('Metadata', {}).get(INDEX_HASH_METADATA_KEY)
+    except ClientError:
+        previous_hash = None
+    if previous_hash == content_hash:
+        print(f"ℹ️  {s3_key} is unchanged in S3 bucket {s3_bucket}, skipping upload")
+        return False
+    s3.put_object(
+        Bucket=s3_bucket,
+        Key=s3_key,
+        Body=gzip.compress(html_bytes, compresslevel=HTML_GZIP_LEVEL),
+        ContentEncoding='gzip',
+        Metadata={INDEX_HASH_METADATA_KEY: content_hash},
+        **INDEX_PAGE_UPLOAD_ARGS
+    )
+    return True
+
+
+def download_index_html_from_s3(html_file_path, s3_bucket='wepl-mainpage'):
+    # upload_index_html_to_s3 stores the page gzip-encoded; write the decoded HTML to disk
+    s3_key = os.path.basename(html_file_path)
+    response = get_s3_client().get_object(Bucket=s3_bucket, Key=s3_key)
+    html_bytes = response['Body'].read()
+    if response.get('ContentEncoding') == 'gzip':
+        html_bytes = gzip.decompress(html_bytes)
+    with open(html_file_path, 'wb') as f:
+        f.write(html_bytes)
+    return html_bytes
+
+
+def upload_html_pages_to_s3(pages, s3_bucket, max_workers=S3_UPLOAD_WORKERS):
+    """
+    Uploads many rendered pages to S3 concurrently over the shared client.
+    
+    Args:
+        pages: List of (s3_key, html_bytes) tuples
+        s3_bucket: Destination S3 bucket
+        max_workers: Maximum number of uploads in flight
+    
+    Returns:
+        list: S3 keys that failed to upload
+    """
+    if not pages:
+        return []
+
+    def upload(page):
+        s3_key, html = page
+        try:
+            upload_html_to_s3(s3_bucket, s3_key, html)
+            return None
+        except Exception as e:
+            print(f"Error uploading detail page {s3_key} to S3: {e}")
+            return s3_key
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(pages))) as executor:
+        failed_keys = [s3_key for s3_key in executor.map(upload, pages) if s3_key]
+    print(f"Uploaded {len(pages) - len(failed_keys)}/{len(pages)} pages to S3 bucket {s3_bucket}")
+    return failed_keys
+
+
 
 
 
@@ -935,15 +1532,8 @@ def fetch_all_posting_types():
     Fetches all posting types from the database and returns them as a dictionary.
     """
     print("Fetching all posting types from the database...")
-    conn = pymysql.connect(
-        host=DB_HOST,
-        port=DB_PORT,
-        db=DB_NAME,
-        user=DB_USER,
-        password=DB_PASSWORD,
-        charset='utf8mb4'
-    )
     try:
+        conn = get_db_connection()
         with conn.cursor(pymysql.cursors.DictCursor) as cur:
             sql = "SELECT * FROM posting_type"
             cur.execute(sql)
@@ -956,18 +1546,29 @@ def fetch_all_posting_types():
     except Exception as e:
         print(f"An error occurred while fetching posting types: {e}")
         return {}
-    finally:
-        print("Closing the database connection...")
-        conn.close()
-        print("Database connection closed.")
 
-# Main function to fetch and print the number of postings from HUG and LH APIs.
-def main():
 
+# Posting types rarely change, so warm containers reuse them for up to this many seconds
+POSTING_TYPES_CACHE_TTL = 300
+_posting_types_cache = {'fetched_at': 0.0, 'data': None}
 
-    
-    
-    
+
+def get_posting_types_cached(ttl=POSTING_TYPES_CACHE_TTL):
+    """
+    Returns fetch_all_posting_types(), re-querying the database at most once per `ttl` seconds.
+    Failed (empty) fetches are not cached.
+    """
+    now = time.monotonic()
+    if _posting_types_cache['data'] is None or now - _posting_types_cache['fetched_at'] > ttl:
+        posting_types = fetch_all_posting_types()
+        if not posting_types:
+            return posting_types
+        _posting_types_cache['data'] = posting_types
+        _posting_types_cache['fetched_at'] = now
+    return _posting_types_cache['data']
+
+# Main function to fetch and print the number of postings from HUG and LH APIs.
+def main():
     # Query DB for oldest posting without video URL and print it
     newest_posting = get_newest_posting_without_video()
     print("\nnewest posting without video URL:")
@@ -987,7 +1588,6 @@ def main():
     print("Fetched posting types:", posting_types)
 
     # Test the generate_detail_page_html function using the newest posting without video URL
-    newest_posting = get_newest_posting_without_video()
     if newest_posting:
         print("Generating detail page HTML for the newest posting...")
         html_output = generate_detail_page_html(newest_posting, posting_types, save_local=True, save_s3=True)
@@ -996,103 +1596,362 @@ def main():
         print("No posting found without video URL to generate detail page.")
 
 
-def append_posting_to_index_html(posting, posting_types, html_file_path="index.html"):
+# Helper to safely get values for the index.html data attributes: None/"" become `default`.
+# Module level so build_appended_housing_row doesn't redefine it for every posting.
+def safe_value(val, default=""):
+    return str(val) if val not in (None, "") else default
+
+
+# Comment markers delimiting the housing items inside <div id="housing-data"> in index.html
+HOUSING_DATA_START_MARKER = '        <!--HOUSING_DATA_START-->\n'
+HOUSING_DATA_END_MARKER = '        <!--HOUSING_DATA_END-->\n'
+
+
+# Opening tag and closing anchor of the housing-data div in index.html pages from before the markers
+_LEGACY_HOUSING_SECTION_OPEN = '<div id="housing-data" class="hidden">'
+_LEGACY_HOUSING_SECTION_CLOSE = '    </div>\n\n    <script src="script.js">'
+
+
+def split_housing_data(html_content):
     """
-    Appends a new posting object to the main HTML page by adding it to the embedded data section.
+    Splits index.html around the housing data between the housing-data markers.
+    Pages without the markers (older index.html) are located by the housing-data div and
+    script tag instead.
+    
+    Returns:
+        tuple: (head, housing_data, tail), or None if the housing-data section could not be found
+    """
+    head, found, rest = html_content.partition(HOUSING_DATA_START_MARKER)
+    if found:
+        housing_data, found, tail = rest.partition(HOUSING_DATA_END_MARKER)
+    if not found:
+        # Plain str.find scans instead of a DOTALL regex over the whole page
+        open_start = html_content.find(_LEGACY_HOUSING_SECTION_OPEN)
+        if open_start == -1:
+            return None
+        open_end = open_start + len(_LEGACY_HOUSING_SECTION_OPEN)
+        close_start = html_content.find(_LEGACY_HOUSING_SECTION_CLOSE, open_end)
+        if close_start == -1:
+            return None
+        head = html_content[:open_end] + '\n'
+        housing_data = html_content[open_end:close_start].lstrip('\n')
+        tail = html_content[close_start:]
+    return head, housing_data, tail
+
+
+def splice_housing_data(html_content, housing_data_html):
+    """
+    Replaces the housing data between the housing-data markers with housing_data_html
+    (newline-terminated markup). Pages without the markers get them added.
+    
+    Returns:
+        str: The updated HTML, or None if the housing-data section could not be found
+    """
+    parts = split_housing_data(html_content)
+    if parts is None:
+        return None
+    head, _, tail = parts
+    return head + HOUSING_DATA_START_MARKER + housing_data_html + HOUSING_DATA_END_MARKER + tail
+
+
+def render_housing_data_page(html_file_path, rows):
+    """
+    Returns the page at html_file_path with the housing rows' JSON block between the
+    housing-data markers, as UTF-8 bytes, without writing anything to disk.
+    
+    Returns:
+        bytes: The updated page, or None if the housing-data section could not be found
+    """
+    start_marker = HOUSING_DATA_START_MARKER.encode('utf-8')
+    end_marker = HOUSING_DATA_END_MARKER.encode('utf-8')
+    with open(html_file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        start = mm.find(start_marker)
+        end = mm.find(end_marker, start + len(start_marker)) if start != -1 else -1
+        if end != -1:
+            return b''.join((
+                mm[:start + len(start_marker)],
+                _HOUSING_DATA_JSON_OPEN_BYTES,
+                serialize_housing_json(rows),
+                _HOUSING_DATA_JSON_CLOSE_BYTES,
+                mm[end:]
+            ))
+        html_content = mm[:].decode('utf-8')
+    updated_html = splice_housing_data(html_content, serialize_housing_data(rows))
+    return updated_html.encode('utf-8') if updated_html is not None else None
+
+
+def replace_housing_data_in_file(html_file_path, rows):
+    """
+    Rewrites the file with the housing rows' JSON block between the housing-data markers.
+    The page is memory-mapped and copied around the markers as raw bytes, and the JSON block is
+    written piecewise straight from the serializer's bytes, so neither is assembled into a str;
+    the result is written to a temp file that atomically replaces the original.
+    Pages without the markers fall back to splice_housing_data.
+    
+    Returns:
+        bool: False if the housing-data section could not be found
+    """
+    start_marker = HOUSING_DATA_START_MARKER.encode('utf-8')
+    end_marker = HOUSING_DATA_END_MARKER.encode('utf-8')
+    tmp_path = html_file_path + '.new'
+    html_content = None
+    with open(html_file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        start = mm.find(start_marker)
+        end = mm.find(end_marker, start + len(start_marker)) if start != -1 else -1
+        if end == -1:
+            html_content = mm[:].decode('utf-8')
+        else:
+            with memoryview(mm) as view, open(tmp_path, 'wb') as out:
+                out.write(view[:start + len(start_marker)])
+                out.write(_HOUSING_DATA_JSON_OPEN_BYTES)
+                out.write(serialize_housing_json(rows))
+                out.write(_HOUSING_DATA_JSON_CLOSE_BYTES)
+                out.write(view[end:])
+
+    if html_content is not None:
+        updated_html = splice_housing_data(html_content, serialize_housing_data(rows))
+        if updated_html is None:
+            return False
+        with open(tmp_path, 'w', encoding='utf-8') as out:
+            out.write(updated_html)
+    os.replace(tmp_path, html_file_path)
+    return True
+
+
+# Housing rows are embedded in index.html as a single JSON array that script.js parses
+HOUSING_DATA_JSON_OPEN = '        <script type="application/json" id="housing-data-json">'
+HOUSING_DATA_JSON_CLOSE = '</script>\n'
+_HOUSING_DATA_JSON_OPEN_BYTES = HOUSING_DATA_JSON_OPEN.encode('utf-8')
+_HOUSING_DATA_JSON_CLOSE_BYTES = HOUSING_DATA_JSON_CLOSE.encode('utf-8')
+
+# data-* attributes of the legacy <div class="housing-item"> markup
+_LEGACY_HOUSING_ATTR_PATTERN = re.compile(r'data-([a-z_]+)="([^"]*)"')
+
+
+def serialize_housing_json(rows):
+    """Returns the housing rows as JSON bytes ('<' is escaped so no value can close the script tag)."""
+    return json_dumps_bytes(rows).replace(b'<', b'\\u003c')
+
+
+def serialize_housing_data(rows):
+    """Returns the JSON script block for the housing rows."""
+    return HOUSING_DATA_JSON_OPEN + serialize_housing_json(rows).decode('utf-8') + HOUSING_DATA_JSON_CLOSE
+
+
+def read_housing_data(html_content):
+    """
+    Returns the housing rows (dicts keyed like the old data-* attributes) embedded in index.html.
+    Pages still using <div class="housing-item"> markup are read from the div attributes.
+    
+    Returns:
+        list: Housing rows, or None if the housing-data section could not be found
+    """
+    parts = split_housing_data(html_content)
+    if parts is None:
+        return None
+    housing_data = parts[1]
+    _, found, json_text = housing_data.partition(HOUSING_DATA_JSON_OPEN)
+    if found:
+        return json_loads(json_text.rpartition(HOUSING_DATA_JSON_CLOSE)[0])
+    return [
+        dict(_LEGACY_HOUSING_ATTR_PATTERN.findall(item))
+        for item in housing_data.split('<div class="housing-item"')[1:]
+    ]
+
+
+def _to_man(value):
+    """Converts a raw limit to a 만원 string ("0" when missing or unparsable)."""
+    try:
+        return str(int(float(value) / 10000)) if value else "0"
+    except (ValueError, TypeError):
+        return "0"
+
+
+def build_posting_type_limits(posting_types):
+    """
+    Pre-computes the (income, asset, vehicle) limits in 만원 for each posting type,
+    so rows only need a dict lookup instead of converting the limits per posting.
+    """
+    return {
+        type_id: (
+            _to_man(details.get('salary_limit')),
+            _to_man(details.get('asset_limit')),
+            _to_man(details.get('vehicle_limit'))
+        )
+        for type_id, details in posting_types.items()
+    }
+
+
+def build_appended_housing_row(posting, type_limits):
+    """Builds the housing row that append_postings_to_index_html adds for a posting."""
+    # Extract posting data with safe defaults
+    notice_id = safe_value(posting.get('posting_id'))
+    status = "Y" if posting.get('summary') != '종료' else "N"  # Y for active, N for ended
+    region_province = safe_value(posting.get('area_province'))
+    region_city = safe_value(posting.get('area_city'))
+    address_detail = safe_value(posting.get('address'))
+    apply_start = safe_value(posting.get('application_start'))
+    apply_end = safe_value(posting.get('application_end'))
+    house_type = safe_value(posting.get('building_type'))
+    supply_type_id = safe_value(posting.get('posting_type_id'), "1")
+    application_url = safe_value(posting.get('application_url'))
+    deposit = safe_value(posting.get('deposit'), "0")
+    monthly_rent = safe_value(posting.get('rent'), "0")
+    agency_id = safe_value(posting.get('agency_id'))
+    
+    # Limits are pre-converted to 만원 units per posting type
+    income_limit, asset_limit, vehicle_limit = type_limits.get(posting.get('posting_type_id'), ("0", "0", "0"))
+    
+    # Create the new housing row
+    return {
+        'notice_id': notice_id,
+        'status': status,
+        'region_province': region_province,
+        'region_city': region_city,
+        'address_detail': address_detail,
+        'apply_start': apply_start,
+        'apply_end': apply_end,
+        'house_type': house_type,
+        'supply_type_id': supply_type_id,
+        'application_url': application_url,
+        'deposit': deposit,
+        'monthly_rent': monthly_rent,
+        'agency_id': agency_id,
+        'income_limit': income_limit,
+        'asset_limit': asset_limit,
+        'vehicle_limit': vehicle_limit
+    }
+
+
+def append_postings_to_index_html(postings, posting_types, html_file_path="index.html"):
+    """
+    Appends a batch of posting objects to the main HTML page by adding them to the embedded data section.
+    The file is read, spliced, written and uploaded to S3 once for the whole batch.
     
     Args:
-        posting: Dictionary containing posting data
+        postings: List of dictionaries containing posting data
         posting_types: Dictionary of posting types for lookups
         html_file_path: Path to the HTML file (default: "index.html")
     """
+    if not postings:
+        return True
     try:
         # Read the existing HTML file
         with open(html_file_path, 'r', encoding='utf-8') as f:
             html_content = f.read()
         
-        # Helper function to safely get values
-        def safe_value(val, default=""):
-            return str(val) if val not in (None, "") else default
-        
-        # Extract posting data with safe defaults
-        notice_id = safe_value(posting.get('posting_id'))
-        status = "Y" if posting.get('summary') != '종료' else "N"  # Y for active, N for ended
-        region_province = safe_value(posting.get('area_province'))
-        region_city = safe_value(posting.get('area_city'))
-        address_detail = safe_value(posting.get('address'))
-        apply_start = safe_value(posting.get('application_start'))
-        apply_end = safe_value(posting.get('application_end'))
-        house_type = safe_value(posting.get('building_type'))
-        supply_type_id = safe_value(posting.get('posting_type_id'), "1")
-        application_url = safe_value(posting.get('application_url'))
-        deposit = safe_value(posting.get('deposit'), "0")
-        monthly_rent = safe_value(posting.get('rent'), "0")
-        agency_id = safe_value(posting.get('agency_id'))
-        
-        # Get posting type details for limits
-        posting_type_details = posting_types.get(posting.get('posting_type_id'), {})
-        income_limit = safe_value(posting_type_details.get('salary_limit'), "0")
-        asset_limit = safe_value(posting_type_details.get('asset_limit'), "0")
-        vehicle_limit = safe_value(posting_type_details.get('vehicle_limit'), "0")
-        
-        # Convert limits from raw numbers to 만원 units (divide by 10000)
-        try:
-            income_limit = str(int(float(income_limit) / 10000)) if income_limit != "0" else "0"
-            asset_limit = str(int(float(asset_limit) / 10000)) if asset_limit != "0" else "0"
-            vehicle_limit = str(int(float(vehicle_limit) / 10000)) if vehicle_limit != "0" else "0"
-        except (ValueError, TypeError):
-            income_limit = asset_limit = vehicle_limit = "0"
-        
-        # Create the new housing item HTML
-        new_housing_item = f'''        <div class="housing-item"
-             data-notice_id="{notice_id}"
-             data-status="{status}"
-             data-region_province="{region_province}"
-             data-region_city="{region_city}"
-             data-address_detail="{address_detail}"
-             data-apply_start="{apply_start}"
-             data-apply_end="{apply_end}"
-             data-house_type="{house_type}"
-             data-supply_type_id="{supply_type_id}"
-             data-application_url="{application_url}"
-             data-deposit="{deposit}"
-             data-monthly_rent="{monthly_rent}"
-             data-agency_id="{agency_id}"
-             data-income_limit="{income_limit}"
-             data-asset_limit="{asset_limit}"
-             data-vehicle_limit="{vehicle_limit}">
-        </div>'''
+        housing_rows = read_housing_data(html_content)
         
-        # Find the closing tag of the housing-data div
-        housing_data_end = html_content.find('    </div>\n\n    <script src="script.js">')
-        
-        if housing_data_end == -1:
+        if housing_rows is None:
             print("Error: Could not find the housing-data section end marker")
             return False
         
-        # Insert the new housing item before the closing div
-        updated_html = (
-            html_content[:housing_data_end] + 
-            new_housing_item + '\n' +
-            html_content[housing_data_end:]
-        )
+        # Add the new housing rows after the existing ones
+        type_limits = build_posting_type_limits(posting_types)
+        housing_rows.extend(build_appended_housing_row(posting, type_limits) for posting in postings)
+        updated_html = splice_housing_data(html_content, serialize_housing_data(housing_rows))
         
         # Write the updated HTML back to the file
         with open(html_file_path, 'w', encoding='utf-8') as f:
             f.write(updated_html)
-        print(f"✅ Successfully appended posting {notice_id} to {html_file_path}")
+        print(f"✅ Successfully appended {len(postings)} postings to {html_file_path}")
         # Upload updated main page to S3
         try:
-            s3 = boto3.client('s3')
-            s3.upload_file(html_file_path, 'wepl-mainpage', os.path.basename(html_file_path), ExtraArgs={'ContentType': 'text/html; charset=utf-8'})
+            upload_index_html_to_s3(html_file_path)
             print(f"Uploaded {html_file_path} to S3 bucket wepl-mainpage")
         except Exception as e:
             print(f"Error uploading main page to S3: {e}")
         return True
     except Exception as e:
-        print(f"❌ Error appending posting to HTML file: {e}")
+        print(f"❌ Error appending postings to HTML file: {e}")
         return False
 
+
+def append_posting_to_index_html(posting, posting_types, html_file_path="index.html"):
+    """
+    Appends a new posting object to the main HTML page by adding it to the embedded data section.
+    Prefer append_postings_to_index_html when adding several postings.
+    
+    Args:
+        posting: Dictionary containing posting data
+        posting_types: Dictionary of posting types for lookups
+        html_file_path: Path to the HTML file (default: "index.html")
+    """
+    return append_postings_to_index_html([posting], posting_types, html_file_path)
+
+# Postings for the index.html data section, joined with their posting type limits
+# (already converted to 만원 units by the database)
+INDEX_POSTINGS_SQL = """
+    SELECT p.posting_id, p.area_province, p.area_city, p.address,
+           p.application_start, p.application_end, p.building_type, p.posting_type_id,
+           p.application_url, p.deposit, p.rent, p.agency_id,
+           (pt.salary_limit DIV 10000) AS income_limit_man,
+           (pt.asset_limit DIV 10000) AS asset_limit_man,
+           (pt.vehicle_limit DIV 10000) AS vehicle_limit_man
+    FROM postings p
+    LEFT JOIN posting_type pt ON pt.posting_type_id = p.posting_type_id
+    ORDER BY p.posting_id DESC
+"""
+
+
+def iter_index_postings():
+    """
+    Yields the INDEX_POSTINGS_SQL rows as posting dicts, streamed through an unbuffered
+    (server-side) cursor so the full result set is never held in memory.
+    """
+    conn = get_json_db_connection()
+    with conn.cursor(pymysql.cursors.SSDictCursor) as cur:
+        cur.execute(INDEX_POSTINGS_SQL)
+        # Rows are already JSON-ready (see get_json_db_connection)
+        yield from cur
+
+
+# (row key, INDEX_POSTINGS_SQL column, default) for the housing rows embedded in index.html.
+# Posting type limits come from the query already in 만원 units.
+_INDEX_ROW_FIELDS = (
+    ('notice_id', 'posting_id', ""),
+    ('region_province', 'area_province', ""),
+    ('region_city', 'area_city', ""),
+    ('address_detail', 'address', ""),
+    ('apply_start', 'application_start', ""),
+    ('apply_end', 'application_end', ""),
+    ('house_type', 'building_type', ""),
+    ('supply_type_id', 'posting_type_id', "1"),
+    ('application_url', 'application_url', ""),
+    ('deposit', 'deposit', "0"),
+    ('monthly_rent', 'rent', "0"),
+    ('agency_id', 'agency_id', ""),
+    ('income_limit', 'income_limit_man', "0"),
+    ('asset_limit', 'asset_limit_man', "0"),
+    ('vehicle_limit', 'vehicle_limit_man', "0"),
+)
+
+
+def build_index_housing_row(posting, status):
+    """Builds the index.html housing row for a row from iter_index_postings with the given status."""
+    # safe_value inlined, with posting.get bound locally: this runs once per field for every
+    # posting in the index
+    get = posting.get
+    row = {}
+    for key, column, default in _INDEX_ROW_FIELDS:
+        value = get(column)
+        row[key] = str(value) if value is not None and value != "" else default
+    row['status'] = status
+    return row
+
+
+def get_index_row_status(posting, today):
+    """Returns 'N' once the posting's application_end is before today, otherwise 'Y'."""
+    try:
+        if posting.get('application_end'):
+            end_date = datetime.datetime.fromisoformat(str(posting['application_end'])).date()
+            if today > end_date:
+                return 'N'
+    except Exception as e:
+        print(f"Error determining status: {e}")
+    return 'Y'
+
+
 def populate_index_html_with_all_postings(html_file_path="index.html"):
     """
     Reads all posting entries from the database and writes them to the index.html file's embedded data section.
@@ -1102,69 +1961,26 @@ def populate_index_html_with_all_postings(html_file_path="index.html"):
         html_file_path: Path to the HTML file (default: "index.html")
     """
     try:
-        # Fetch all postings from database
+        # Build all housing rows (serialized once as JSON),
+        # converting each posting as it streams in from the database
         print("Connecting to database to fetch all postings...")
-        conn = pymysql.connect(
-            host=DB_HOST,
-            port=DB_PORT,
-            db=DB_NAME,
-            user=DB_USER,
-            password=DB_PASSWORD,
-            charset='utf8mb4'
-        )
-        
-        postings = []
-        posting_types = {}
-        
-        try:
-            # Fetch all posting types for lookup
-            with conn.cursor(pymysql.cursors.DictCursor) as cur:
-                cur.execute("SELECT * FROM posting_type")
-                posting_type_rows = cur.fetchall()
-                posting_types = {row["posting_type_id"]: row for row in posting_type_rows}
-            
-            # Fetch all postings
-            with conn.cursor(pymysql.cursors.DictCursor) as cur:
-                cur.execute("SELECT * FROM postings ORDER BY posting_id DESC")
-                posting_rows = cur.fetchall()
-                postings = [make_json_serializable(row) for row in posting_rows]
-                
-            print(f"✅ Fetched {len(postings)} postings and {len(posting_types)} posting types from database")
-            
-        finally:
-            conn.close()
+        housing_items = []
+        today = datetime.date.today()
         
-        # Read the existing HTML file
-        with open(html_file_path, 'r', encoding='utf-8') as f:
-            html_content = f.read()
-        
-        # Helper function to safely get values
-        def safe_value(val, default=""):
-            return str(val) if val not in (None, "") else default
-        
-        # Build all housing items HTML
-        housing_items_html = ""
-        
-        for posting in postings:
-            # Extract posting data with safe defaults
-            notice_id = safe_value(posting.get('posting_id'))
-            
+        for posting in iter_index_postings():
             # Determine status based on application dates
-            today = datetime.date.today()
             status = "Y"  # Default to active
-            
-            import datetime
 
             try:
                 apply_start_str = str(posting.get('application_start'))
                 apply_end_str = str(posting.get('application_end'))
 
                 if apply_start_str and apply_end_str and apply_start_str != 'None' and apply_end_str != 'None':
-                    apply_start = datetime.datetime.strptime(apply_start_str, '%Y-%m-%d').date()
-                    apply_end = datetime.datetime.strptime(apply_end_str, '%Y-%m-%d').date()
+                    apply_start = datetime.date.fromisoformat(apply_start_str[:10])
+                    apply_end = datetime.date.fromisoformat(apply_end_str[:10])
 
                     # Status logic: Y for active (공고중/접수중), N for ended (종료)
-                    if datetime.date.today() <= apply_end:
+                    if today <= apply_end:
                         status = "Y"
                     else:
                         status = "N"
@@ -1172,82 +1988,19 @@ def populate_index_html_with_all_postings(html_file_path="index.html"):
                 # If date parsing fails, default to active
                 status = "Y"
 
-            
-            # Extract other fields
-            region_province = safe_value(posting.get('area_province'))
-            region_city = safe_value(posting.get('area_city'))
-            address_detail = safe_value(posting.get('address'))
-            apply_start = safe_value(posting.get('application_start'))
-            apply_end = safe_value(posting.get('application_end'))
-            house_type = safe_value(posting.get('building_type'))
-            supply_type_id = safe_value(posting.get('posting_type_id'), "1")
-            application_url = safe_value(posting.get('application_url'))
-            deposit = safe_value(posting.get('deposit'), "0")
-            monthly_rent = safe_value(posting.get('rent'), "0")
-            agency_id = safe_value(posting.get('agency_id'))
-            
-            # Get posting type details for limits
-            posting_type_details = posting_types.get(posting.get('posting_type_id'), {})
-            income_limit = safe_value(posting_type_details.get('salary_limit'), "0")
-            asset_limit = safe_value(posting_type_details.get('asset_limit'), "0")
-            vehicle_limit = safe_value(posting_type_details.get('vehicle_limit'), "0")
-            
-            # Convert limits from raw numbers to 만원 units (divide by 10000)
-            try:
-                income_limit = str(int(float(income_limit) / 10000)) if income_limit != "0" else "0"
-                asset_limit = str(int(float(asset_limit) / 10000)) if asset_limit != "0" else "0"
-                vehicle_limit = str(int(float(vehicle_limit) / 10000)) if vehicle_limit != "0" else "0"
-            except (ValueError, TypeError):
-                income_limit = asset_limit = vehicle_limit = "0"
-            
-            # Create the housing item HTML
-            housing_item = f'''        <div class="housing-item"
-             data-notice_id="{notice_id}"
-             data-status="{status}"
-             data-region_province="{region_province}"
-             data-region_city="{region_city}"
-             data-address_detail="{address_detail}"
-             data-apply_start="{apply_start}"
-             data-apply_end="{apply_end}"
-             data-house_type="{house_type}"
-             data-supply_type_id="{supply_type_id}"
-             data-application_url="{application_url}"
-             data-deposit="{deposit}"
-             data-monthly_rent="{monthly_rent}"
-             data-agency_id="{agency_id}"
-             data-income_limit="{income_limit}"
-             data-asset_limit="{asset_limit}"
-             data-vehicle_limit="{vehicle_limit}">
-        </div>'''
-            
-            housing_items_html += housing_item + '\n'
+            # Create the housing row
+            housing_items.append(build_index_housing_row(posting, status))
         
-        # Find the housing-data section boundaries
-        housing_data_start = html_content.find('<div id="housing-data" class="hidden">')
-        housing_data_end = html_content.find('    </div>\n\n    <script src="script.js">')
+        print(f"✅ Fetched {len(housing_items)} postings from database")
         
-        if housing_data_start == -1 or housing_data_end == -1:
+        # Replace the content between the housing-data markers and write the file back
+        if not replace_housing_data_in_file(html_file_path, housing_items):
             print("❌ Error: Could not find the housing-data section boundaries")
             return False
-        
-        # Find the end of the opening div tag
-        opening_tag_end = html_content.find('>', housing_data_start) + 1
-        
-        # Replace the content between the housing-data div tags
-        updated_html = (
-            html_content[:opening_tag_end] + '\n' +
-            housing_items_html +
-            html_content[housing_data_end:]
-        )
-        
-        # Write the updated HTML back to the file
-        with open(html_file_path, 'w', encoding='utf-8') as f:
-            f.write(updated_html)
-        print(f"✅ Successfully populated {html_file_path} with {len(postings)} postings from database")
+        print(f"✅ Successfully populated {html_file_path} with {len(housing_items)} postings from database")
         # Upload updated main page to S3
         try:
-            s3 = boto3.client('s3')
-            s3.upload_file(html_file_path, 'wepl-mainpage', os.path.basename(html_file_path), ExtraArgs={'ContentType': 'text/html; charset=utf-8'})
+            upload_index_html_to_s3(html_file_path)
             print(f"Uploaded {html_file_path} to S3 bucket wepl-mainpage")
         except Exception as e:
             print(f"Error uploading main page to S3: {e}")
@@ -1256,263 +2009,58 @@ def populate_index_html_with_all_postings(html_file_path="index.html"):
         print(f"❌ Error populating HTML file with database postings: {e}")
         return False
 
-def sync_all_postings_to_html(html_file_path="index.html"):
+def sync_all_postings_to_html(html_file_path="index.html", save_local=True, postings=None):
     """
     Syncs all postings from the database to index.html by replacing the housing-data section,
     and uploads the updated index.html to the 'wepl-mainpage' S3 bucket.
+    With save_local=False the local file is only read as the page template; the updated
+    page is built in memory and uploaded directly.
+    postings: INDEX_POSTINGS_SQL rows the caller already fetched (default: streamed from the database)
     """
-    # Fetch postings and posting types
-    print("Starting database to HTML sync...")
-    try:
-        conn = pymysql.connect(
-            host=DB_HOST, port=DB_PORT, db=DB_NAME,
-            user=DB_USER, password=DB_PASSWORD, charset='utf8mb4'
-        )
-        with conn.cursor(pymysql.cursors.DictCursor) as cur:
-            cur.execute("SELECT * FROM posting_type")
-            posting_types = {row['posting_type_id']: row for row in cur.fetchall()}
-            cur.execute("SELECT * FROM postings ORDER BY posting_id DESC")
-            postings = [make_json_serializable(row) for row in cur.fetchall()]
-    except Exception as e:
-        print(f"Error fetching data from database: {e}")
-        return False
-    finally:
-        conn.close()
-
-    if not postings:
-        print("No postings found in database to sync.")
-        return False
-
-    # Read existing index.html
-    try:
-        with open(html_file_path, 'r', encoding='utf-8') as f:
-            html_content = f.read()
-    except Exception as e:
-        print(f"Error reading {html_file_path}: {e}")
-        return False
-
-    # Helper function for safe value handling
-    def safe_value(val, default=""):
-        return str(val) if val not in (None, "") else default
-
-    # Build housing items
-    items_html = []
-    for p in postings:
-        # Determine status
-        status = 'Y'
-        try:
-            if p.get('application_end'):
-                end_date = datetime.datetime.fromisoformat(str(p['application_end'])).date()
-                if datetime.date.today() > end_date:
-                    status = 'N'
-        except Exception as e:
-            print(f"Error determining status: {e}")
-            pass
-
-        # Get posting type details and format limits
-        posting_type = posting_types.get(p.get('posting_type_id'), {})
-        income_limit = '0'
-        asset_limit = '0'
-        vehicle_limit = '0'
-
-        try:
-            if posting_type.get('salary_limit'):
-                income_limit = str(int(float(posting_type['salary_limit']) / 10000))
-            if posting_type.get('asset_limit'):
-                asset_limit = str(int(float(posting_type['asset_limit']) / 10000))
-            if posting_type.get('vehicle_limit'):
-                vehicle_limit = str(int(float(posting_type['vehicle_limit']) / 10000))
-        except (ValueError, TypeError) as e:
-            print(f"Error formatting limits: {e}")
-
-        # Generate housing item div
-        item_div = f'''        <div class="housing-item"
-             data-notice_id="{safe_value(p.get('posting_id'))}"
-             data-status="{status}"
-             data-region_province="{safe_value(p.get('area_province'))}"
-             data-region_city="{safe_value(p.get('area_city'))}"
-             data-address_detail="{safe_value(p.get('address'))}"
-             data-apply_start="{safe_value(p.get('application_start'))}"
-             data-apply_end="{safe_value(p.get('application_end'))}"
-             data-house_type="{safe_value(p.get('building_type'))}"
-             data-supply_type_id="{safe_value(p.get('posting_type_id'), '1')}"
-             data-application_url="{safe_value(p.get('application_url'))}"
-             data-deposit="{safe_value(p.get('deposit'), '0')}"
-             data-monthly_rent="{safe_value(p.get('rent'), '0')}"
-             data-agency_id="{safe_value(p.get('agency_id'))}"
-             data-income_limit="{income_limit}"
-             data-asset_limit="{asset_limit}"
-             data-vehicle_limit="{vehicle_limit}">
-        </div>'''
-        items_html.append(item_div)
-
-    # Find the housing-data section boundaries
-    housing_data_start = html_content.find('<div id="housing-data" class="hidden">')
-    housing_data_end = html_content.find('    </div>\n\n    <script src="script.js">')
-    
-    if housing_data_start == -1 or housing_data_end == -1:
-        print("Error: Could not find housing-data section markers in HTML file")
-        return False
-    
-    # Find the end of the opening div tag
-    opening_tag_end = html_content.find('>', housing_data_start) + 1
-    
-    # Replace the content between the housing-data div tags
-    updated_html = (
-        html_content[:opening_tag_end] + '\n' +
-        '\n'.join(items_html) + '\n' +
-        html_content[housing_data_end:]
-    )
-    
-    # Write the updated HTML back to the file
-    try:
-        with open(html_file_path, 'w', encoding='utf-8') as f:
-            f.write(updated_html)
-        print(f"✅ Successfully synced {len(postings)} postings to {html_file_path}")
-    except Exception as e:
-        print(f"Error writing HTML file: {e}")
-        return False
-    
-    # Upload updated main page to S3
-    try:
-        s3 = boto3.client('s3')
-        s3.upload_file(html_file_path, 'wepl-mainpage', os.path.basename(html_file_path), 
-                      ExtraArgs={'ContentType': 'text/html; charset=utf-8'})
-        print(f"✅ Uploaded {html_file_path} to S3 bucket wepl-mainpage")
-    except Exception as e:
-        print(f"⚠️  Could not upload to S3: {e}")
-    
-    return True
-
-
-def check_pub_api():
-    """Check the public APIs for connectivity and data availability"""
-    print("🔍 Checking public API connectivity...")
-    
-    # Check HUG API
-    try:
-        response = requests.get(api_url_hug, timeout=10)
-        response.raise_for_status()
-        hug_data = response.json()
-        hug_count = len(hug_data.get('response', {}).get('body', {}).get('item', []))
-        print(f"✅ HUG API: Connected successfully, {hug_count} items available")
-    except Exception as e:
-        print(f"❌ HUG API: Failed to connect - {e}")
-    
-    # Check LH API
-    try:
-        response = requests.get(api_url_lh, timeout=10)
-        response.raise_for_status()
-        lh_data = response.json()
-        lh_items = lh_data.get('response', {}).get('body', {}).get('item', [])
-        if not isinstance(lh_items, list):
-            lh_items = [lh_items]
-        print(f"✅ LH API: Connected successfully, {len(lh_items)} items available")
-    except Exception as e:
-        print(f"❌ LH API: Failed to connect - {e}")
-
-
-def is_lambda_environment():
-    """Check if we're running in AWS Lambda environment"""
-    return os.environ.get('AWS_LAMBDA_FUNCTION_NAME') is not None
-
-
-def complete_lh_workflow(save_local=False, save_s3=True):
-    """
-    Complete LH workflow: fetch data, process, save to DB, generate pages, sync index.
-    Now works with improved Secrets Manager integration.
-    """
-    print("🚀 Starting complete LH workflow...")
-    
-    try:
-        # Step 1: Fetch LH API data
-        print("\n📡 Step 1: Fetching LH API data...")
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            lh_data_raw = loop.run_until_complete(get_lh_api())
-        finally:
-            loop.close()
-        
-        if not lh_data_raw:
-            print("❌ No data from LH API")
-            return {'success': False, 'error': 'No LH API data'}
-        
-        print(f"✅ Fetched {len(lh_data_raw)} items from LH API")
-        
-        # Step 2: Extract and structure fields
-        print("\n🔧 Step 2: Processing LH data...")
-        extracted_data = extract_lh_fields({'response': {'body': {'item': lh_data_raw}}})
-        
-        if not extracted_data:
-            print("❌ No data extracted from LH response")
-            return {'success': False, 'error': 'No extracted data'}
-        
-        print(f"✅ Extracted {len(extracted_data)} structured postings")
-        
-        # Step 3: Filter new postings
-        print("\n🔍 Step 3: Filtering new postings...")
-        new_postings = filter_new_postings(extracted_data)
-        print(f"✅ Found {len(new_postings)} new postings to process")
-        
-        if not new_postings:
-            print("ℹ️  No new postings to process")
-            return {'success': True, 'new_postings': 0, 'message': 'No new postings found'}
-        
-        # Step 4: Save new postings to database
-        print(f"\n💾 Step 4: Saving {len(new_postings)} postings to database...")
-        saved_count = 0
-        for posting in new_postings:
-            try:
-                save_posting_to_db(posting)
-                saved_count += 1
-            except Exception as e:
-                print(f"❌ Failed to save posting {posting.get('posting_id')}: {e}")
-        
-        print(f"✅ Saved {saved_count}/{len(new_postings)} postings to database")
-        
-        # Step 5: Generate detail pages for new postings
-        if saved_count > 0:
-            print(f"\n📄 Step 5: Generating detail pages...")
-            posting_types = fetch_all_posting_types()
-            pages_generated = 0
-            
-            for posting in new_postings:
-                try:
-                    # Convert to proper posting object format
-                    posting_obj = convert_to_posting_object(posting)
-                    generate_detail_page_html(posting_obj, posting_types, 
-                                            save_local=save_local, save_s3=save_s3)
-                    pages_generated += 1
-                except Exception as e:
-                    print(f"❌ Failed to generate page for posting {posting.get('posting_id')}: {e}")
-            
-            print(f"✅ Generated {pages_generated} detail pages")
-        
-        # Step 6: Sync index.html with database
-        print("\n🔄 Step 6: Syncing index.html with database...")
-        sync_success = sync_all_postings_to_html()
-        
-        if sync_success:
-            print("✅ Successfully synced index.html with database")
+    print("Starting database to HTML sync...")
+
+    if not os.path.exists(html_file_path):
+        print(f"Error reading {html_file_path}: file not found")
+        return False
+
+    # Build housing rows, converting postings as they stream in from the database
+    today = datetime.date.today()
+    try:
+        if postings is None:
+            postings = iter_index_postings()
+        items_html = [build_index_housing_row(p, get_index_row_status(p, today)) for p in postings]
+    except Exception as e:
+        print(f"Error fetching data from database: {e}")
+        return False
+
+    if not items_html:
+        print("No postings found in database to sync.")
+        return False
+
+    # Replace the content between the housing-data markers (writing the file back if saving locally)
+    html_bytes = None
+    try:
+        if save_local:
+            updated = replace_housing_data_in_file(html_file_path, items_html)
         else:
-            print("⚠️  Index sync completed with warnings")
-        
-        print(f"\n🎉 LH workflow completed successfully!")
-        print(f"   • New postings processed: {saved_count}")
-        print(f"   • Detail pages generated: {pages_generated if saved_count > 0 else 0}")
-        print(f"   • Index sync: {'Success' if sync_success else 'Warning'}")
-        
-        return {
-            'success': True,
-            'new_postings': saved_count,
-            'detail_pages_generated': pages_generated if saved_count > 0 else 0,
-            'index_synced': sync_success
-        }
-        
+            html_bytes = render_housing_data_page(html_file_path, items_html)
+            updated = html_bytes is not None
+        if not updated:
+            print("Error: Could not find housing-data section markers in HTML file")
+            return False
+        print(f"✅ Successfully synced {len(items_html)} postings to {html_file_path}")
     except Exception as e:
-        print(f"❌ LH workflow failed: {e}")
-        return {'success': False, 'error': str(e)}
+        print(f"Error writing HTML file: {e}")
+        return False
+    
+    # Upload updated main page to S3
+    try:
+        upload_index_html_to_s3(html_file_path, html_bytes=html_bytes)
+        print(f"✅ Uploaded {html_file_path} to S3 bucket wepl-mainpage")
+    except Exception as e:
+        print(f"⚠️  Could not upload to S3: {e}")
+    
+    return True
 
 
 def convert_to_posting_object(extracted_posting):
@@ -1531,59 +2079,12 @@ def convert_to_posting_object(extracted_posting):
         'deposit': extracted_posting.get('deposit'),
         'rent': extracted_posting.get('rent'),
         'summary': extracted_posting.get('posting_summary', ''),
-        'rawjson': json.dumps(extracted_posting, ensure_ascii=False),
+        'rawjson': json_dumps(extracted_posting),
         's3_object_address': None,
         'youtube_url': None
     }
 
 
-def save_posting_to_db(posting):
-    """Save a single posting object to the database"""
-    conn = pymysql.connect(
-        host=DB_HOST, port=DB_PORT, db=DB_NAME,
-        user=DB_USER, password=DB_PASSWORD, charset='utf8mb4'
-    )
-    
-    try:
-        with conn.cursor() as cur:
-            sql = """
-                INSERT INTO postings 
-                (posting_id, posting_type_id, agency_id, area_province, area_city, 
-                 address, application_start, application_end, building_type, 
-                 application_url, deposit, rent, summary, rawjson)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                ON DUPLICATE KEY UPDATE
-                application_end = VALUES(application_end),
-                deposit = VALUES(deposit),
-                rent = VALUES(rent),
-                summary = VALUES(summary),
-                rawjson = VALUES(rawjson)
-            """
-            
-            values = (
-                posting.get('posting_id'),
-                1,  # Default posting_type_id for LH
-                '1',  # agency_id for LH
-                posting.get('prefecture'),
-                posting.get('city'),
-                posting.get('detailed_address'),
-                posting.get('application_start_date'),
-                posting.get('application_end_date'),
-                posting.get('building_type'),
-                posting.get('application_url'),
-                float(posting.get('deposit')) if posting.get('deposit') else None,
-                float(posting.get('rent')) if posting.get('rent') else None,
-                posting.get('posting_summary', ''),
-                json.dumps(posting, ensure_ascii=False)
-            )
-            
-            cur.execute(sql, values)
-        conn.commit()
-        
-    finally:
-        conn.close()
-
-
 # Lambda handler function
 def lambda_handler(event, context):
     """
@@ -1600,7 +2101,7 @@ def lambda_handler(event, context):
             result = complete_lh_workflow(save_local=False, save_s3=True)
             
         elif action == 'sync_index':
-            result = {'success': sync_all_postings_to_html()}
+            result = {'success': sync_all_postings_to_html(save_local=False)}
             
         elif action == 'check_apis':
             check_pub_api()
@@ -1610,72 +2111,32 @@ def lambda_handler(event, context):
             days = event.get('days', 7)
             result = update_recent_detail_pages(days=days, save_local=False, save_s3=True)
             
+        elif action == 'generate_all':
+            # Renders every detail page; uploads run concurrently on the shared S3 client
+            result = update_all_detail_pages(
+                save_local=False, save_s3=True,
+                s3_bucket=event.get('s3_detail_bucket', 'wepl-posting-pages'),
+                force_upload=event.get('force_upload', False)
+            )
+            
+        elif action == 'create_indexes':
+            result = {'success': True, 'created_indexes': create_postings_indexes()}
+            
         else:
             result = {'success': False, 'error': f'Unknown action: {action}'}
         
         return {
             'statusCode': 200,
-            'body': json.dumps(result, ensure_ascii=False)
+            'body': json_dumps(result)
         }
         
     except Exception as e:
         print(f"❌ Lambda function error: {e}")
         return {
             'statusCode': 500,
-            'body': json.dumps({'success': False, 'error': str(e)}, ensure_ascii=False)
+            'body': json_dumps({'success': False, 'error': str(e)})
         }
-        item_div = f'''        <div class="housing-item"
-             data-notice_id="{safe_value(p.get('posting_id'))}"
-             data-status="{status}"
-             data-region_province="{safe_value(p.get('area_province'))}"
-             data-region_city="{safe_value(p.get('area_city'))}"
-             data-address_detail="{safe_value(p.get('address'))}"
-             data-apply_start="{safe_value(p.get('application_start'))}"
-             data-apply_end="{safe_value(p.get('application_end'))}"
-             data-house_type="{safe_value(p.get('building_type'))}"
-             data-supply_type_id="{safe_value(p.get('posting_type_id'), '1')}"
-             data-application_url="{safe_value(p.get('application_url'))}"
-             data-deposit="{safe_value(p.get('deposit'), '0')}"
-             data-monthly_rent="{safe_value(p.get('rent'), '0')}"
-             data-agency_id="{safe_value(p.get('agency_id'))}"
-             data-income_limit="{income_limit}"
-             data-asset_limit="{asset_limit}"
-             data-vehicle_limit="{vehicle_limit}">
-        </div>'''
-        items_html.append(item_div)
 
-    # Replace housing-data section in HTML
-    housing_data_start = html_content.find('<div id="housing-data" class="hidden">')
-    housing_data_end = html_content.find('    </div>\n\n    <script src="script.js">')
-    
-    if housing_data_start == -1 or housing_data_end == -1:
-        print("❌ Error: Could not find the housing-data section in HTML")
-        return False
-
-    opening_tag_end = html_content.find('>', housing_data_start) + 1
-    updated_html = (
-        html_content[:opening_tag_end] + '\n' +
-        '\n'.join(items_html) +  # Fixed: Changed items_html.join('\n') to '\n'.join(items_html)
-        html_content[housing_data_end:]
-    )
-
-    # Write and upload
-    try:
-        with open(html_file_path, 'w', encoding='utf-8') as f:
-            f.write(updated_html)
-        
-        s3 = boto3.client('s3')
-        s3.upload_file(
-            html_file_path, 
-            'wepl-mainpage', 
-            os.path.basename(html_file_path), 
-            ExtraArgs={'ContentType': 'text/html; charset=utf-8'}
-        )
-        print(f"✅ Successfully uploaded {html_file_path} to S3 bucket wepl-mainpage")
-        return True
-    except Exception as e:
-        print(f"❌ Error saving or uploading file: {e}")
-        return False
 
 def check_pub_api():
     """
@@ -1708,6 +2169,7 @@ def check_pub_api():
         
         # Step 3: Process each new posting (add AI summaries)
         summarized_postings = []  # Initialize the list
+        standardized_postings = []
         
         for i, posting in enumerate(new_postings, 1):  # Add the missing for loop
             print(f"   Processing posting {i}/{len(new_postings)}: {posting.get('posting_id')}")
@@ -1727,109 +2189,123 @@ def check_pub_api():
                     'deposit': posting.get('deposit'),
                     'rent': posting.get('rent'),
                     'summary': posting.get('posting_summary', ''),
-                    'rawjson': json.dumps(posting, ensure_ascii=False),
+                    'rawjson': json_dumps(posting),
                     's3_object_address': None,
                     'youtube_url': None
                 }
-
-                # Generate AI summary
-                posting_with_summary = get_ai_summary_for_posting(standardized_posting)
-                summarized_postings.append(posting_with_summary)
-                print(f"   ✅ AI summary generated: {posting_with_summary.get('ai_summary', '')[:50]}...")
+                standardized_postings.append(standardized_posting)
 
             except Exception as e:
                 posting['ai_summary'] = '요약 생성 실패'
                 summarized_postings.append(posting)
                 print(f"   ❌ Error processing posting {posting.get('posting_id')}: {e}")
 
+        # Generate AI summaries concurrently
+        for posting_with_summary in get_ai_summaries_for_postings(standardized_postings):
+            summarized_postings.append(posting_with_summary)
+            print(f"   ✅ AI summary generated: {posting_with_summary.get('ai_summary', '')[:50]}...")
+
         print(f"✅ Generated AI summaries for {len(summarized_postings)} postings")
 
         # Step 4: Write summarized postings to database
         print("💾 Writing new postings to database...")
 
-        conn = pymysql.connect(
-            host=DB_HOST, port=DB_PORT, db=DB_NAME,
-            user=DB_USER, password=DB_PASSWORD, charset='utf8mb4'
-        )
+        conn = get_db_connection()
 
-        try:
-            with conn.cursor() as cur:
-                # Prepare SQL for inserting postings
-                sql = """
-                INSERT INTO postings 
-                (posting_id, posting_type_id, agency_id, area_province, area_city, 
-                 address, application_start, application_end, building_type, 
-                 application_url, deposit, rent, summary, rawjson, ai_summary)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                ON DUPLICATE KEY UPDATE
-                ai_summary = VALUES(ai_summary),
-                summary = VALUES(summary),
-                rawjson = VALUES(rawjson)
-                """
+        with conn.cursor() as cur:
+            # Prepare SQL for inserting postings
+            sql = """
+            INSERT INTO postings 
+            (posting_id, posting_type_id, agency_id, area_province, area_city, 
+             address, application_start, application_end, building_type, 
+             application_url, deposit, rent, summary, rawjson, ai_summary)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE
+            ai_summary = VALUES(ai_summary),
+            summary = VALUES(summary),
+            rawjson = VALUES(rawjson)
+            """
 
-                inserted_count = 0
-                for posting in summarized_postings:
-                    try:
-                        values = (
-                            posting.get('posting_id'),
-                            posting.get('posting_type_id', 1),
-                            posting.get('agency_id', 'LH'),
-                            posting.get('area_province'),
-                            posting.get('area_city'),
-                            posting.get('address'),
-                            posting.get('application_start'),
-                            posting.get('application_end'),
-                            posting.get('building_type'),
-                            posting.get('application_url'),
-                            float(posting.get('deposit', 0)) if posting.get('deposit') else None,
-                            float(posting.get('rent', 0)) if posting.get('rent') else None,
-                            posting.get('summary', ''),
-                            posting.get('rawjson'),
-                            posting.get('ai_summary', '')
-                        )
+            values_list = []
+            for posting in summarized_postings:
+                try:
+                    values_list.append((
+                        posting.get('posting_id'),
+                        posting.get('posting_type_id', 1),
+                        posting.get('agency_id', 'LH'),
+                        posting.get('area_province'),
+                        posting.get('area_city'),
+                        posting.get('address'),
+                        posting.get('application_start'),
+                        posting.get('application_end'),
+                        posting.get('building_type'),
+                        posting.get('application_url'),
+                        float(posting.get('deposit', 0)) if posting.get('deposit') else None,
+                        float(posting.get('rent', 0)) if posting.get('rent') else None,
+                        posting.get('summary', ''),
+                        posting.get('rawjson'),
+                        posting.get('ai_summary', '')
+                    ))
 
-                        cur.execute(sql, values)
-                        inserted_count += 1
+                except Exception as e:
+                    print(f"   ❌ Error inserting posting {posting.get('posting_id')}: {e}")
 
+            # One batched statement instead of a round-trip per posting; if the batch
+            # is rejected, retry row by row so one bad posting doesn't drop the rest
+            saved_count = 0
+            try:
+                conn.begin()
+                if values_list:
+                    cur.executemany(sql, values_list)
+                conn.commit()
+                saved_count = len(values_list)
+            except Exception as e:
+                conn.rollback()
+                print(f"   ⚠️ Batch insert failed ({e}), inserting postings one by one...")
+                conn.begin()
+                for values in values_list:
+                    try:
+                        cur.execute(sql, values)
+                        saved_count += 1
                     except Exception as e:
-                        print(f"   ❌ Error inserting posting {posting.get('posting_id')}: {e}")
-
+                        print(f"   ❌ Error inserting posting {values[0]}: {e}")
                 conn.commit()
-                print(f"✅ Successfully inserted/updated {inserted_count} postings in database")
 
-        finally:
-            conn.close()
+            print(f"✅ Successfully inserted/updated {saved_count} postings in database")
 
         # Step 5: Generate detail pages for the summarized postings
         print("📄 Generating detail pages for new postings...")
 
         # Fetch posting types for detail page generation
-        posting_types = fetch_all_posting_types()
+        posting_types = get_posting_types_cached()
 
         detail_pages_generated = 0
+        rendered_pages = []
         for posting in summarized_postings:
             try:
-                # Generate detail page HTML and save to S3
-                generate_detail_page_html(
+                # Generate detail page HTML; uploads are batched below
+                html = generate_detail_page_html(
                     posting, 
                     posting_types, 
                     save_local=False,  # Don't save locally in production
-                    save_s3=True,
-                    s3_bucket='wepl-posting-pages',
-                    s3_folder=None
+                    save_s3=False
                 )
+                rendered_pages.append((get_detail_page_filename(posting), html))
                 detail_pages_generated += 1
                 print(f"   ✅ Generated detail page for posting {posting.get('posting_id')}")
 
             except Exception as e:
                 print(f"   ❌ Error generating detail page for posting {posting.get('posting_id')}: {e}")
 
+        # Upload all detail pages to S3 concurrently
+        upload_html_pages_to_s3(rendered_pages, 'wepl-posting-pages')
+
         print(f"✅ Generated {detail_pages_generated} detail pages")
 
         # Step 6: Update main HTML page with all postings (including new ones)
         print("🔄 Updating main HTML page...")
 
-        success = sync_all_postings_to_html('index.html')
+        success = sync_all_postings_to_html('index.html', save_local=False)
         if success:
             print("✅ Main HTML page updated and uploaded to S3")
         else:
@@ -1867,7 +2343,99 @@ def check_pub_api():
 
 #check_pub_api()
 
-def update_all_detail_pages(save_local=False, save_s3=True, s3_bucket='wepl-posting-pages', s3_folder=None):
+# Number of postings between progress lines while rendering detail pages
+DETAIL_PROGRESS_INTERVAL = 50
+
+
+def render_and_upload_detail_pages(posting_rows, posting_types, total_postings, save_local=False, save_s3=True,
+                                   s3_bucket='wepl-posting-pages', s3_folder=None, skip_unchanged=False):
+    """
+    Renders a detail page for each posting row and uploads it to S3 in the background.
+    
+    Each page is handed to the upload pool as soon as it is rendered, so the S3
+    round-trips overlap with rendering the remaining postings. At most
+    MAX_PENDING_UPLOADS pages are held in memory waiting for their upload.
+    
+    Args:
+        posting_rows: Iterable of posting rows (a list or a streaming cursor)
+        posting_types: Posting types dict, or None when the rows carry the joined type columns
+        total_postings: Number of rows, for progress output
+        skip_unchanged: Skip uploading pages whose content matches the object already in S3
+            (compared by ETag, listed once up front; header-only changes are not detected)
+    
+    Returns:
+        tuple: (successful_updates, failed_posting_ids)
+    """
+    successful_updates = 0
+    failed_posting_ids = []
+    # (threads only start on the first submit, so save_s3=False costs nothing)
+    pending_uploads = {}
+    upload_failures = 0
+    uploaded_pages = 0
+    unchanged_pages = 0
+    existing_etags = {}
+    if save_s3 and skip_unchanged:
+        try:
+            existing_etags = list_object_etags(s3_bucket, f"{s3_folder}/" if s3_folder else '')
+        except Exception as e:
+            print(f"⚠️ Could not list {s3_bucket}, uploading every page: {e}")
+
+    def collect_uploads(done):
+        nonlocal upload_failures, uploaded_pages, unchanged_pages, successful_updates
+        for future in done:
+            s3_key, posting_id = pending_uploads.pop(future)
+            try:
+                if future.result():
+                    uploaded_pages += 1
+                else:
+                    unchanged_pages += 1
+            except Exception as e:
+                print(f"Error uploading detail page {s3_key} to S3: {e}")
+                upload_failures += 1
+                successful_updates -= 1
+                failed_posting_ids.append(posting_id)
+
+    with ThreadPoolExecutor(max_workers=S3_UPLOAD_WORKERS) as upload_executor:
+        for i, posting in enumerate(posting_rows, 1):
+            posting_id = posting.get('posting_id')
+            try:
+                # Generate detail page HTML; the upload runs in the background pool
+                html_output = generate_detail_page_html(
+                    posting, 
+                    posting_types, 
+                    save_local=save_local,
+                    save_s3=False
+                )
+                if save_s3:
+                    if len(pending_uploads) >= MAX_PENDING_UPLOADS:
+                        done, _ = wait(pending_uploads, return_when=FIRST_COMPLETED)
+                        collect_uploads(done)
+                    s3_key = get_detail_page_filename(posting, s3_folder)
+                    future = upload_executor.submit(upload_html_to_s3, s3_bucket, s3_key, html_output, existing_etags.get(s3_key))
+                    pending_uploads[future] = (s3_key, posting_id)
+            
+                successful_updates += 1
+            
+            except Exception as e:
+                failed_posting_ids.append(posting_id)
+                print(f"   ❌ Failed to update detail page for posting {posting_id}: {e}")
+            
+            # Progress is printed every DETAIL_PROGRESS_INTERVAL postings rather than per posting
+            if i % DETAIL_PROGRESS_INTERVAL == 0 or i == total_postings:
+                print(f"   Processed {i}/{total_postings} postings ({len(failed_posting_ids)} failed)")
+        
+        # Wait for the remaining uploads (the worker pool bounds the S3 request rate)
+        collect_uploads(as_completed(list(pending_uploads)))
+    if uploaded_pages or upload_failures:
+        print(f"Uploaded {uploaded_pages}/{uploaded_pages + upload_failures} pages to S3 bucket {s3_bucket}")
+    if unchanged_pages:
+        print(f"Skipped {unchanged_pages} unchanged pages")
+    
+    return successful_updates, failed_posting_ids
+
+
+def update_all_detail_pages(save_local=False, save_s3=True, s3_bucket='wepl-posting-pages', s3_folder=None,
+                            force_upload=False):
     """
     Queries all rows from the database and updates all detail pages.
     Generates fresh detail page HTML for every posting in the database.
@@ -1877,6 +2445,8 @@ def update_all_detail_pages(save_local=False, save_s3=True, s3_bucket='wepl-post
         save_s3: Whether to save HTML files to S3 (default: True)
         s3_bucket: S3 bucket name for detail pages (default: 'wepl-posting-pages')
         s3_folder: S3 folder prefix (default: None)
+        force_upload: Upload every page even if its content is unchanged in S3, e.g. to apply
+            new upload headers (default: False)
     
     Returns:
         dict: Summary of the update process
@@ -1890,90 +2460,41 @@ def update_all_detail_pages(save_local=False, save_s3=True, s3_bucket='wepl-post
     failed_posting_ids = []
     
     try:
-        # Step 1: Fetch all posting types for detail page generation
-        print("📋 Fetching posting types from database...")
-        posting_types = fetch_all_posting_types()
-        if not posting_types:
-            print("❌ Failed to fetch posting types from database")
+        # Step 1-2: Connect to database and fetch all postings (posting types are joined in)
+        print("🔗 Connecting to database...")
+        conn = get_json_db_connection()
+        
+        with conn.cursor() as cur:
+            cur.execute("SELECT COUNT(*) FROM postings")
+            total_postings = cur.fetchone()[0]
+        print(f"✅ Found {total_postings} postings in database")
+        
+        if total_postings == 0:
+            print("⚠️ No postings found in database")
             return {
-                'success': False,
-                'error': 'Failed to fetch posting types',
+                'success': True,
+                'message': 'No postings found to update',
                 'total_postings': 0,
                 'successful_updates': 0,
                 'failed_updates': 0
             }
-        print(f"✅ Fetched {len(posting_types)} posting types")
-        
-        # Step 2: Connect to database and fetch all postings
-        print("🔗 Connecting to database...")
-        conn = pymysql.connect(
-            host=DB_HOST,
-            port=DB_PORT,
-            db=DB_NAME,
-            user=DB_USER,
-            password=DB_PASSWORD,
-            charset='utf8mb4'
-        )
-        
-        try:
-            with conn.cursor(pymysql.cursors.DictCursor) as cur:
-                # Query all postings ordered by posting_id descending (newest first)
-                sql = "SELECT * FROM postings ORDER BY posting_id DESC"
-                cur.execute(sql)
-                print("📊 Executing query to fetch all postings...")
-                
-                posting_rows = cur.fetchall()
-                total_postings = len(posting_rows)
-                print(f"✅ Fetched {total_postings} postings from database")
-                
-                if total_postings == 0:
-                    print("⚠️ No postings found in database")
-                    return {
-                        'success': True,
-                        'message': 'No postings found to update',
-                        'total_postings': 0,
-                        'successful_updates': 0,
-                        'failed_updates': 0
-                    }
-
-                # Step 3: Process each posting
-                print("🔄 Processing postings and generating detail pages...")
-                
-                for i, row in enumerate(posting_rows, 1):
-                    try:
-                        # Convert database row to posting object
-                        posting = make_json_serializable(row)
-                        posting_id = posting.get('posting_id')
-                        
-                        print(f"   Processing {i}/{total_postings}: Posting ID {posting_id}")
-                        
-                        # Generate detail page HTML
-                        html_output = generate_detail_page_html(
-                            posting, 
-                            posting_types, 
-                            save_local=save_local,
-                            save_s3=save_s3,
-                            s3_bucket=s3_bucket,
-                            s3_folder=s3_folder
-                        )
-                        
-                        successful_updates += 1
-                        print(f"   ✅ Successfully updated detail page for posting {posting_id}")
-                        
-                        # Add a small delay to avoid overwhelming S3 API
-                        if save_s3 and i % 10 == 0:
-                            import time
-                            time.sleep(0.5)  # 500ms delay every 10 uploads
-                        
-                    except Exception as e:
-                        failed_updates += 1
-                        failed_posting_ids.append(posting_id)
-                        print(f"   ❌ Failed to update detail page for posting {posting_id}: {e}")
-                        continue
-                
-        finally:
-            conn.close()
-            print("🔒 Database connection closed")
+
+        # Step 3: Process each posting
+        print("🔄 Processing postings and generating detail pages...")
+        
+        # Rows are streamed from the server (SSDictCursor) instead of fetched all at once;
+        # rows from the JSON-ready connection are already posting objects
+        with conn.cursor(pymysql.cursors.SSDictCursor) as cur:
+            # Query all postings with their posting type, newest first
+            cur.execute(DETAIL_POSTINGS_SQL)
+            print("📊 Executing query to stream all postings...")
+            successful_updates, failed_posting_ids = render_and_upload_detail_pages(
+                cur, None, total_postings,
+                save_local=save_local, save_s3=save_s3,
+                s3_bucket=s3_bucket, s3_folder=s3_folder,
+                skip_unchanged=not force_upload
+            )
+        failed_updates = len(failed_posting_ids)
         
         # Step 4: Summary
         print("\n🎉 Detail page update process completed!")
@@ -2031,61 +2552,33 @@ def update_detail_pages_by_agency(agency_id, save_local=False, save_s3=True, s3_
     failed_posting_ids = []
     
     try:
-        # Fetch posting types
-        posting_types = fetch_all_posting_types()
-        if not posting_types:
-            print("❌ Failed to fetch posting types from database")
-            return {'success': False, 'error': 'Failed to fetch posting types'}
+        # Connect to database (rows come back JSON-ready, with the posting type joined in)
+        conn = get_json_db_connection()
         
-        # Connect to database
-        conn = pymysql.connect(
-            host=DB_HOST, port=DB_PORT, db=DB_NAME,
-            user=DB_USER, password=DB_PASSWORD, charset='utf8mb4'
-        )
+        with conn.cursor() as cur:
+            cur.execute("SELECT COUNT(*) FROM postings WHERE agency_id = %s", (agency_id,))
+            total_postings = cur.fetchone()[0]
+        print(f"✅ Found {total_postings} postings for agency {agency_id}")
         
-        try:
-            with conn.cursor(pymysql.cursors.DictCursor) as cur:
-                # Query postings for specific agency
-                sql = "SELECT * FROM postings WHERE agency_id = %s ORDER BY posting_id DESC"
-                cur.execute(sql, (agency_id,))
-                
-                posting_rows = cur.fetchall()
-                total_postings = len(posting_rows)
-                print(f"✅ Found {total_postings} postings for agency {agency_id}")
-                
-                if total_postings == 0:
-                    return {
-                        'success': True,
-                        'message': f'No postings found for agency {agency_id}',
-                        'total_postings': 0,
-                        'successful_updates': 0,
-                        'failed_updates': 0
-                    }
-                
-                # Process each posting
-                for i, row in enumerate(posting_rows, 1):
-                    try:
-                        posting = make_json_serializable(row)
-                        posting_id = posting.get('posting_id')
-                        
-                        print(f"   Processing {i}/{total_postings}: Posting ID {posting_id}")
-                        
-                        generate_detail_page_html(
-                            posting, posting_types, 
-                            save_local=save_local, save_s3=save_s3,
-                            s3_bucket=s3_bucket, s3_folder=s3_folder
-                        )
-                        
-                        successful_updates += 1
-                        print(f"   ✅ Updated detail page for posting {posting_id}")
-                        
-                    except Exception as e:
-                        failed_updates += 1
-                        failed_posting_ids.append(posting_id)
-                        print(f"   ❌ Failed to update posting {posting_id}: {e}")
-                
-        finally:
-            conn.close()
+        if total_postings == 0:
+            return {
+                'success': True,
+                'message': f'No postings found for agency {agency_id}',
+                'total_postings': 0,
+                'successful_updates': 0,
+                'failed_updates': 0
+            }
+        
+        # Stream the agency's postings from the server; uploads overlap with rendering
+        with conn.cursor(pymysql.cursors.SSDictCursor) as cur:
+            sql = DETAIL_POSTINGS_SELECT + "    WHERE p.agency_id = %s\n    ORDER BY p.posting_id DESC\n"
+            cur.execute(sql, (agency_id,))
+            successful_updates, failed_posting_ids = render_and_upload_detail_pages(
+                cur, None, total_postings,
+                save_local=save_local, save_s3=save_s3,
+                s3_bucket=s3_bucket, s3_folder=s3_folder
+            )
+        failed_updates = len(failed_posting_ids)
         
         # Summary
         print(f"\n🎉 Agency {agency_id} detail page update completed!")
@@ -2113,13 +2606,18 @@ def update_detail_pages_by_agency(agency_id, save_local=False, save_s3=True, s3_
         }
 
 
-def remove_obsolete_postings_from_index(html_file_path="index.html"):
+def remove_obsolete_postings_from_index(html_file_path="index.html", current_db_posting_ids=None, upload=True, save_local=True):
     """
     Removes postings from index.html that are no longer present in the database.
     Compares current database postings with HTML file and removes obsolete entries.
     
     Args:
         html_file_path: Path to the HTML file (default: "index.html")
+        current_db_posting_ids: Set of posting IDs (as strings) already fetched by the caller
+            (default: None, queried from the database)
+        upload: Whether to upload the updated file to S3 (default: True)
+        save_local: Whether to write the updated file back to html_file_path (default: True);
+            with save_local=False the updated page is uploaded straight from memory
     
     Returns:
         dict: Summary of the removal process
@@ -2127,22 +2625,17 @@ def remove_obsolete_postings_from_index(html_file_path="index.html"):
     print("🚀 Starting removal of obsolete postings from index.html...")
     
     try:
-        # Step 1: Get current posting IDs from database
-        print("📊 Fetching current posting IDs from database...")
-        conn = pymysql.connect(
-            host=DB_HOST, port=DB_PORT, db=DB_NAME,
-            user=DB_USER, password=DB_PASSWORD, charset='utf8mb4'
-        )
-        
-        current_db_posting_ids = set()
-        try:
+        # Step 1: Count current postings in database
+        if current_db_posting_ids is None:
+            print("📊 Counting current postings in database...")
+            conn = get_db_connection()
             with conn.cursor() as cur:
-                cur.execute("SELECT posting_id FROM postings")
-                current_db_posting_ids = {str(row[0]) for row in cur.fetchall()}
-        finally:
-            conn.close()
+                cur.execute("SELECT COUNT(*) FROM postings")
+                total_db_postings = cur.fetchone()[0]
+        else:
+            total_db_postings = len(current_db_posting_ids)
         
-        print(f"✅ Found {len(current_db_posting_ids)} postings in database")
+        print(f"✅ Found {total_db_postings} postings in database")
         
         # Step 2: Read current HTML file
         try:
@@ -2153,14 +2646,18 @@ def remove_obsolete_postings_from_index(html_file_path="index.html"):
             return {'success': False, 'error': f'Failed to read HTML file: {e}'}
         
         # Step 3: Extract posting IDs from HTML
-        import re
-        html_posting_pattern = r'data-notice_id="([^"]+)"'
-        html_posting_matches = re.findall(html_posting_pattern, html_content)
-        html_posting_ids = set(html_posting_matches)
+        housing_rows = read_housing_data(html_content)
+        if housing_rows is None:
+            print(f"❌ Error: Could not find the housing-data section in {html_file_path}")
+            return {'success': False, 'error': 'Could not find the housing-data section'}
+        html_posting_ids = {row.get('notice_id') for row in housing_rows}
         
         print(f"✅ Found {len(html_posting_ids)} postings in HTML file")
         
-        # Step 4: Identify obsolete postings (in HTML but not in DB)
+        # Step 4: Identify obsolete postings (in HTML but not in DB). Without the caller's ID set
+        # only the IDs on the page are looked up, so memory is bounded by the page, not the table
+        if current_db_posting_ids is None:
+            current_db_posting_ids = get_existing_posting_ids(html_posting_ids)
         obsolete_posting_ids = html_posting_ids - current_db_posting_ids
         
         if not obsolete_posting_ids:
@@ -2169,58 +2666,45 @@ def remove_obsolete_postings_from_index(html_file_path="index.html"):
                 'success': True,
                 'message': 'No obsolete postings found',
                 'total_html_postings': len(html_posting_ids),
-                'total_db_postings': len(current_db_posting_ids),
+                'total_db_postings': total_db_postings,
                 'removed_postings': 0,
                 'removed_posting_ids': []
             }
         
         print(f"🗑️ Found {len(obsolete_posting_ids)} obsolete postings to remove: {list(obsolete_posting_ids)}")
         
-        # Step 5: Remove obsolete postings from HTML
-        updated_html = html_content
-        removed_count = 0
+        # Step 5: Remove obsolete postings from HTML (only built if it is saved or uploaded)
+        removed_count = len(obsolete_posting_ids)
+        if save_local or upload:
+            remaining_rows = [row for row in housing_rows if row.get('notice_id') not in obsolete_posting_ids]
+            updated_html = splice_housing_data(html_content, serialize_housing_data(remaining_rows))
         
         for posting_id in obsolete_posting_ids:
-            # Pattern to match the entire housing-item div for this posting
-            posting_div_pattern = rf'        <div class="housing-item"\s+data-notice_id="{re.escape(posting_id)}"[^>]*>.*?        </div>\n'
-            
-            # Remove the posting div
-            old_length = len(updated_html)
-            updated_html = re.sub(posting_div_pattern, '', updated_html, flags=re.DOTALL)
-            
-            if len(updated_html) < old_length:
-                removed_count += 1
-                print(f"   ✅ Removed posting {posting_id} from HTML")
-            else:
-                print(f"   ⚠️ Could not find posting {posting_id} div to remove")
+            print(f"   ✅ Removed posting {posting_id} from HTML")
         
         # Step 6: Write updated HTML file
-        try:
-            with open(html_file_path, 'w', encoding='utf-8') as f:
-                f.write(updated_html)
-            print(f"✅ Updated {html_file_path} with {removed_count} postings removed")
-        except Exception as e:
-            print(f"❌ Error writing updated HTML file: {e}")
-            return {'success': False, 'error': f'Failed to write HTML file: {e}'}
+        if save_local:
+            try:
+                with open(html_file_path, 'w', encoding='utf-8') as f:
+                    f.write(updated_html)
+                print(f"✅ Updated {html_file_path} with {removed_count} postings removed")
+            except Exception as e:
+                print(f"❌ Error writing updated HTML file: {e}")
+                return {'success': False, 'error': f'Failed to write HTML file: {e}'}
         
         # Step 7: Upload updated HTML to S3
-        try:
-            s3 = boto3.client('s3')
-            s3.upload_file(
-                html_file_path, 
-                'wepl-mainpage', 
-                os.path.basename(html_file_path), 
-                ExtraArgs={'ContentType': 'text/html; charset=utf-8'}
-            )
-            print(f"✅ Uploaded updated {html_file_path} to S3 bucket wepl-mainpage")
-        except Exception as e:
-            print(f"⚠️ Warning: Failed to upload to S3: {e}")
+        if upload:
+            try:
+                upload_index_html_to_s3(html_file_path, html_bytes=None if save_local else updated_html.encode('utf-8'))
+                print(f"✅ Uploaded updated {html_file_path} to S3 bucket wepl-mainpage")
+            except Exception as e:
+                print(f"⚠️ Warning: Failed to upload to S3: {e}")
         
         # Step 8: Summary
         print(f"\n🎉 Obsolete posting removal completed!")
         print(f"   📊 Summary:")
         print(f"   • Total postings in HTML (before): {len(html_posting_ids)}")
-        print(f"   • Total postings in database: {len(current_db_posting_ids)}")
+        print(f"   • Total postings in database: {total_db_postings}")
         print(f"   • Obsolete postings identified: {len(obsolete_posting_ids)}")
         print(f"   • Postings successfully removed: {removed_count}")
         print(f"   • Remaining postings in HTML: {len(html_posting_ids) - removed_count}")
@@ -2228,7 +2712,7 @@ def remove_obsolete_postings_from_index(html_file_path="index.html"):
         return {
             'success': True,
             'total_html_postings': len(html_posting_ids),
-            'total_db_postings': len(current_db_posting_ids),
+            'total_db_postings': total_db_postings,
             'obsolete_postings_identified': len(obsolete_posting_ids),
             'removed_postings': removed_count,
             'removed_posting_ids': list(obsolete_posting_ids),
@@ -2244,10 +2728,10 @@ def remove_obsolete_postings_from_index(html_file_path="index.html"):
             'removed_posting_ids': []
         }
 
-def sync_index_with_database(html_file_path="index.html"):
+def sync_index_with_database(html_file_path="index.html", save_local=True):
     """
     Comprehensive sync function that:
-    1. Downloads index.html from S3 if running in Lambda and file doesn't exist locally
+    1. Downloads index.html from S3 to /tmp if running in Lambda and file doesn't exist there
     2. Removes obsolete postings from index.html (not in database)
     3. Updates index.html with all current database postings
     4. Uploads the updated file to S3
@@ -2256,6 +2740,8 @@ def sync_index_with_database(html_file_path="index.html"):
     
     Args:
         html_file_path: Path to the HTML file (default: "index.html")
+        save_local: Whether to write the synced page back to html_file_path (default: True);
+            with save_local=False it is built in memory and uploaded directly
     
     Returns:
         dict: Summary of the sync process
@@ -2263,12 +2749,14 @@ def sync_index_with_database(html_file_path="index.html"):
     print("🚀 Starting comprehensive sync of index.html with database...")
     
     try:
-        # Step 0: In Lambda environment, download index.html from S3 if it doesn't exist locally
+        # Step 0: In Lambda environment, download index.html from S3 if it doesn't exist locally.
+        # The deployment package directory is read-only there, so the page template lives in /tmp
+        if is_lambda_environment():
+            html_file_path = os.path.join('/tmp', os.path.basename(html_file_path))
         if is_lambda_environment() and not os.path.exists(html_file_path):
             print("📥 Lambda environment detected - downloading index.html from S3...")
             try:
-                s3 = boto3.client('s3')
-                s3.download_file('wepl-mainpage', 'index.html', html_file_path)
+                download_index_html_from_s3(html_file_path)
                 print(f"✅ Downloaded index.html from S3 to {html_file_path}")
             except Exception as e:
                 print(f"⚠️  Could not download index.html from S3: {e}")
@@ -2284,6 +2772,8 @@ def sync_index_with_database(html_file_path="index.html"):
 </head>
 <body>
     <div id="housing-data" class="hidden">
+        <!--HOUSING_DATA_START-->
+        <!--HOUSING_DATA_END-->
     </div>
 
     <script src="script.js"></script>
@@ -2293,9 +2783,16 @@ def sync_index_with_database(html_file_path="index.html"):
                     f.write(minimal_html)
                 print("✅ Created minimal index.html template")
         
-        # Step 1: Remove obsolete postings first
+        # Query the postings once; the removal step only needs their IDs
+        index_postings = list(iter_index_postings())
+        current_db_posting_ids = {str(p['posting_id']) for p in index_postings}
+        
+        # Step 1: Identify obsolete postings. Step 2 rewrites the whole housing-data section from
+        # the same rows and uploads it, so this step neither writes the file nor touches S3
         print("🗑️ Step 1: Removing obsolete postings...")
-        removal_result = remove_obsolete_postings_from_index(html_file_path)
+        removal_result = remove_obsolete_postings_from_index(
+            html_file_path, current_db_posting_ids, upload=False, save_local=False
+        )
         
         if not removal_result['success']:
             print("❌ Failed to remove obsolete postings")
@@ -2305,7 +2802,7 @@ def sync_index_with_database(html_file_path="index.html"):
         
         # Step 2: Update with all current database postings
         print("🔄 Step 2: Updating with current database postings...")
-        sync_result = sync_all_postings_to_html(html_file_path)
+        sync_result = sync_all_postings_to_html(html_file_path, save_local=save_local, postings=index_postings)
         
         if not sync_result:
             print("❌ Failed to sync current postings")
@@ -2418,98 +2915,109 @@ def complete_lh_workflow(save_local=False, save_s3=True):
         # Step 3: Generate AI summaries for each new posting
         print("🤖 Step 3: Generating AI summaries for new postings...")
         summarized_postings = []
+        standardized_postings = []
         
         for i, posting in enumerate(new_postings, 1):
             print(f"   Processing posting {i}/{len(new_postings)}: {posting.get('posting_id')}")
-            try:
-                # Convert LH format to standard posting format
-                standardized_posting = {
-                    'posting_id': posting.get('posting_id'),
-                    'posting_type_id': 1,  # Default to LH type
-                    'agency_id': 'LH',
-                    'area_province': posting.get('prefecture'),
-                    'area_city': posting.get('city'),
-                    'address': posting.get('detailed_address'),
-                    'application_start': posting.get('application_start_date'),
-                    'application_end': posting.get('application_end_date'),
-                    'building_type': posting.get('building_type'),
-                    'application_url': posting.get('application_url'),
-                    'deposit': posting.get('deposit'),
-                    'rent': posting.get('rent'),
-                    'summary': posting.get('posting_summary', ''),
-                    'rawjson': json.dumps(posting, ensure_ascii=False),
-                    's3_object_address': None,
-                    'youtube_url': None
-                }
-                
-                # Generate AI summary
-                posting_with_summary = get_ai_summary_for_posting(standardized_posting)
+            # Convert LH format to standard posting format
+            standardized_postings.append({
+                'posting_id': posting.get('posting_id'),
+                'posting_type_id': 1,  # Default to LH type
+                'agency_id': 'LH',
+                'area_province': posting.get('prefecture'),
+                'area_city': posting.get('city'),
+                'address': posting.get('detailed_address'),
+                'application_start': posting.get('application_start_date'),
+                'application_end': posting.get('application_end_date'),
+                'building_type': posting.get('building_type'),
+                'application_url': posting.get('application_url'),
+                'deposit': posting.get('deposit'),
+                'rent': posting.get('rent'),
+                'summary': posting.get('posting_summary', ''),
+                'rawjson': json_dumps(posting),
+                's3_object_address': None,
+                'youtube_url': None
+            })
+        
+        # Generate AI summaries concurrently
+        try:
+            for posting_with_summary in get_ai_summaries_for_postings(standardized_postings):
                 summarized_postings.append(posting_with_summary)
                 workflow_results['ai_summaries_generated'] += 1
                 print(f"   ✅ AI summary generated: {posting_with_summary.get('summary', '')[:50]}...")
                 
-            except Exception as e:
-                error_msg = f"Error generating AI summary for posting {posting.get('posting_id')}: {str(e)}"
-                print(f"   ❌ {error_msg}")
-                workflow_results['errors'].append(error_msg)
-                # Add posting without AI summary
+        except Exception as e:
+            error_msg = f"Error generating AI summaries: {str(e)}"
+            print(f"   ❌ {error_msg}")
+            workflow_results['errors'].append(error_msg)
+            # Keep postings without AI summary
+            for standardized_posting in standardized_postings:
                 standardized_posting['summary'] = '요약 생성 실패'
-                summarized_postings.append(standardized_posting)
+            summarized_postings = standardized_postings
         
         print(f"✅ Generated AI summaries for {workflow_results['ai_summaries_generated']} postings")
         
         # Step 4: Save summarized postings to database
         print("💾 Step 4: Saving new postings to database...")
         try:
-            conn = pymysql.connect(
-                host=DB_HOST, port=DB_PORT, db=DB_NAME,
-                user=DB_USER, password=DB_PASSWORD, charset='utf8mb4'
-            )
+            conn = get_db_connection()
             
-            try:
-                with conn.cursor() as cur:
-                    # Prepare SQL for inserting postings
-                    sql = """
-                    INSERT INTO postings 
-                    (posting_id, posting_type_id, agency_id, area_province, area_city, 
-                     address, application_start, application_end, building_type, 
-                     application_url, deposit, rent, summary, rawjson)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    ON DUPLICATE KEY UPDATE
-                    summary = VALUES(summary),
-                    rawjson = VALUES(rawjson)
-                    """
-                    
-                    for posting in summarized_postings:
+            with conn.cursor() as cur:
+                # Prepare SQL for inserting postings
+                sql = """
+                INSERT INTO postings 
+                (posting_id, posting_type_id, agency_id, area_province, area_city, 
+                 address, application_start, application_end, building_type, 
+                 application_url, deposit, rent, summary, rawjson)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                ON DUPLICATE KEY UPDATE
+                summary = VALUES(summary),
+                rawjson = VALUES(rawjson)
+                """
+                
+                rows = [(
+                    posting.get('posting_id'),
+                    posting.get('posting_type_id', 1),
+                    posting.get('agency_id', 'LH'),
+                    posting.get('area_province'),
+                    posting.get('area_city'),
+                    posting.get('address'),
+                    posting.get('application_start'),
+                    posting.get('application_end'),
+                    posting.get('building_type'),
+                    posting.get('application_url'),
+                    posting.get('deposit'),
+                    posting.get('rent'),
+                    posting.get('summary'),
+                    posting.get('rawjson')
+                ) for posting in summarized_postings]
+                
+                # One batched statement instead of a round-trip per posting; if the batch
+                # is rejected, retry row by row so one bad posting doesn't drop the rest.
+                # The shared connection autocommits, so both paths run in an explicit
+                # transaction to commit (and fsync) once rather than per statement.
+                try:
+                    conn.begin()
+                    if rows:
+                        cur.executemany(sql, rows)
+                    conn.commit()
+                    workflow_results['postings_saved_to_db'] += len(rows)
+                except Exception as e:
+                    conn.rollback()
+                    print(f"   ⚠️ Batch insert failed ({e}), saving postings one by one...")
+                    conn.begin()
+                    for row in rows:
                         try:
-                            cur.execute(sql, (
-                                posting.get('posting_id'),
-                                posting.get('posting_type_id', 1),
-                                posting.get('agency_id', 'LH'),
-                                posting.get('area_province'),
-                                posting.get('area_city'),
-                                posting.get('address'),
-                                posting.get('application_start'),
-                                posting.get('application_end'),
-                                posting.get('building_type'),
-                                posting.get('application_url'),
-                                posting.get('deposit'),
-                                posting.get('rent'),
-                                posting.get('summary'),
-                                posting.get('rawjson')
-                            ))
+                            cur.execute(sql, row)
                             workflow_results['postings_saved_to_db'] += 1
                             
                         except Exception as e:
-                            error_msg = f"Error saving posting {posting.get('posting_id')} to database: {str(e)}"
+                            error_msg = f"Error saving posting {row[0]} to database: {str(e)}"
                             print(f"   ❌ {error_msg}")
                             workflow_results['errors'].append(error_msg)
-                    
                     conn.commit()
-                    print(f"✅ Successfully saved {workflow_results['postings_saved_to_db']} postings to database")
-                    
-            finally:
-                conn.close()
+                
+                print(f"✅ Successfully saved {workflow_results['postings_saved_to_db']} postings to database")
                 
         except Exception as e:
             error_msg = f"Error connecting to database: {str(e)}"
@@ -2521,29 +3029,20 @@ def complete_lh_workflow(save_local=False, save_s3=True):
         print("📄 Step 5: Generating detail pages for new postings...")
         try:
             # Fetch posting types for detail page generation
-            posting_types = fetch_all_posting_types()
+            posting_types = get_posting_types_cached()
             if not posting_types:
                 error_msg = "Failed to fetch posting types for detail page generation"
                 print(f"❌ {error_msg}")
                 workflow_results['errors'].append(error_msg)
             else:
-                for posting in summarized_postings:
-                    try:
-                        generate_detail_page_html(
-                            posting,
-                            posting_types,
-                            save_local=save_local,
-                            save_s3=save_s3,
-                            s3_bucket='wepl-posting-pages',
-                            s3_folder=None
-                        )
-                        workflow_results['detail_pages_generated'] += 1
-                        print(f"   ✅ Generated detail page for posting {posting.get('posting_id')}")
-                        
-                    except Exception as e:
-                        error_msg = f"Error generating detail page for posting {posting.get('posting_id')}: {str(e)}"
-                        print(f"   ❌ {error_msg}")
-                        workflow_results['errors'].append(error_msg)
+                # Uploads run in the background pool while the remaining pages render
+                generated, failed_posting_ids = render_and_upload_detail_pages(
+                    summarized_postings, posting_types, len(summarized_postings),
+                    save_local=save_local, save_s3=save_s3
+                )
+                workflow_results['detail_pages_generated'] += generated
+                for posting_id in failed_posting_ids:
+                    workflow_results['errors'].append(f"Error generating or uploading detail page for posting {posting_id}")
                 
                 print(f"✅ Generated {workflow_results['detail_pages_generated']} detail pages")
                 
@@ -2555,7 +3054,7 @@ def complete_lh_workflow(save_local=False, save_s3=True):
         # Step 6: Update index.html with all current database postings
         print("🔄 Step 6: Updating index.html with current database state...")
         try:
-            sync_result = sync_index_with_database('index.html')
+            sync_result = sync_index_with_database('index.html', save_local=save_local)
             if sync_result and sync_result.get('success'):
                 workflow_results['index_updated'] = True
                 print("✅ Index.html updated and uploaded to S3")
@@ -2636,57 +3135,28 @@ def update_recent_detail_pages(days=30, save_local=False, save_s3=True, s3_bucke
         cutoff_date = datetime.date.today() - datetime.timedelta(days=days)
         print(f"📅 Updating postings with application_end >= {cutoff_date}")
         
-        # Fetch posting types
-        posting_types = fetch_all_posting_types()
-        if not posting_types:
-            return {'success': False, 'error': 'Failed to fetch posting types'}
-        
-        # Connect to database
-        conn = pymysql.connect(
-            host=DB_HOST, port=DB_PORT, db=DB_NAME,
-            user=DB_USER, password=DB_PASSWORD, charset='utf8mb4'
-        )
+        # Connect to database (rows come back JSON-ready, with the posting type joined in)
+        conn = get_json_db_connection()
         
         total_postings = 0
         successful_updates = 0
         failed_updates = 0
         
-        try:
-            with conn.cursor(pymysql.cursors.DictCursor) as cur:
-                # Query recent postings
-                sql = """
-                SELECT * FROM postings 
-                WHERE application_end >= %s 
-                ORDER BY posting_id DESC
-                """
-                cur.execute(sql, (cutoff_date,))
-                
-                posting_rows = cur.fetchall()
-                total_postings = len(posting_rows)
-                print(f"✅ Found {total_postings} recent postings")
-                
-                # Process each posting
-                for i, row in enumerate(posting_rows, 1):
-                    try:
-                        posting = make_json_serializable(row)
-                        posting_id = posting.get('posting_id')
-                        
-                        print(f"   Processing {i}/{total_postings}: Posting ID {posting_id}")
-                        
-                        generate_detail_page_html(
-                            posting, posting_types,
-                            save_local=save_local, save_s3=save_s3,
-                            s3_bucket=s3_bucket, s3_folder=s3_folder
-                        )
-                        
-                        successful_updates += 1
-                        
-                    except Exception as e:
-                        failed_updates += 1
-                        print(f"   ❌ Failed to update posting {posting_id}: {e}")
-                
-        finally:
-            conn.close()
+        with conn.cursor() as cur:
+            cur.execute("SELECT COUNT(*) FROM postings WHERE application_end >= %s", (cutoff_date,))
+            total_postings = cur.fetchone()[0]
+        print(f"✅ Found {total_postings} recent postings")
+        
+        # Stream recent postings from the server; uploads overlap with rendering
+        with conn.cursor(pymysql.cursors.SSDictCursor) as cur:
+            sql = DETAIL_POSTINGS_SELECT + "    WHERE p.application_end >= %s\n    ORDER BY p.posting_id DESC\n"
+            cur.execute(sql, (cutoff_date,))
+            successful_updates, failed_posting_ids = render_and_upload_detail_pages(
+                cur, None, total_postings,
+                save_local=save_local, save_s3=save_s3,
+                s3_bucket=s3_bucket, s3_folder=s3_folder
+            )
+        failed_updates = len(failed_posting_ids)
         
         print(f"\n🎉 Recent detail pages update completed!")
         print(f"   • Total: {total_postings}, Success: {successful_updates}, Failed: {failed_updates}")
@@ -2710,9 +3180,9 @@ def update_recent_detail_pages(days=30, save_local=False, save_s3=True, s3_bucke
 # Main workflow functions for different use cases
 # complete_lh_workflow()  # Complete LH API workflow
 # get_lh_api()  # Just fetch from API
+# fetch_all_postings()  # Fetch HUG and LH concurrently
 # filter_new_postings()  # Filter postings
 # get_ai_summary_for_posting()  # Generate AI summaries
-# save_posting_to_db()  # Save to database
 # generate_detail_page_html()  # Generate detail pages
 # sync_index_with_database()  # Sync index with database
 
@@ -2725,6 +3195,25 @@ def update_recent_detail_pages(days=30, save_local=False, save_s3=True, s3_bucke
 
 # sync_index_with_database()
 
+def warm_up_container():
+    """
+    Create the shared clients during the Lambda init phase so the first invocation
+    doesn't pay for them. Failures are only logged; each client is created lazily again on use.
+    """
+    for name, warm in (
+        ("S3 client", get_s3_client),
+        ("LH SSL context", get_lh_ssl_context),
+        ("DB connection", get_db_connection),
+    ):
+        try:
+            warm()
+        except Exception as e:
+            print(f"⚠️  Could not warm up {name}: {e}")
+
+
+if is_lambda_environment():
+    warm_up_container()
+
 # Execute sync function when run directly
 if __name__ == "__main__":
     # Sync index.html with database
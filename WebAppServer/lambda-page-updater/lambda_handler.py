@@ -1,6 +1,8 @@
+import gzip
 import json
 import os
 import boto3
+from botocore.config import Config
 from apitest03 import (
     generate_detail_page_html,
     generate_html_for_all_postings,
@@ -13,6 +15,38 @@ from apitest03 import (
 )
 import pymysql
 
+# orjson writes UTF-8 directly and is much faster than json.dumps(ensure_ascii=False); optional
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+SUPPORTED_ACTIONS = ('generate_all', 'generate_specific', 'sync_index', 'generate_summaries')
+
+# Same headers and encoding as lambda-render-pages.py uses for the main page
+INDEX_PAGE_UPLOAD_ARGS = {
+    'ContentType': 'text/html; charset=utf-8',
+    'CacheControl': 'public, max-age=60, stale-while-revalidate=300',
+    'ContentEncoding': 'gzip'
+}
+HTML_GZIP_LEVEL = 6
+
+# Shared S3 client, reused across warm invocations
+s3_client = boto3.client(
+    's3',
+    config=Config(
+        max_pool_connections=10,
+        tcp_keepalive=True,
+        retries={'max_attempts': 10, 'mode': 'adaptive'}
+    )
+)
+
+def dumps_response_body(payload):
+    """Serialize a response payload to JSON text, keeping Korean text unescaped"""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(payload, ensure_ascii=False)
+
 def lambda_handler(event, context):
     """
     AWS Lambda handler for generating and uploading housing detail pages.
@@ -33,13 +67,26 @@ def lambda_handler(event, context):
         s3_main_bucket = event.get('s3_main_bucket', 'wepl-mainpage')
         posting_ids = event.get('posting_ids', [])
         
+        # Reject bad payloads before doing any work
+        if action not in SUPPORTED_ACTIONS:
+            return {
+                'statusCode': 400,
+                'body': dumps_response_body({
+                    'error': f'Unknown action: {action}'
+                })
+            }
+        if action == 'generate_specific' and not posting_ids:
+            return {
+                'statusCode': 400,
+                'body': dumps_response_body({
+                    'error': 'posting_ids required for generate_specific action'
+                })
+            }
+        
         print(f"Lambda execution started - Action: {action}")
         print(f"S3 Detail Bucket: {s3_detail_bucket}")
         print(f"S3 Main Bucket: {s3_main_bucket}")
         
-        # Initialize S3 client
-        s3_client = boto3.client('s3')
-        
         results = {}
         
         if action == 'generate_all':
@@ -53,14 +100,6 @@ def lambda_handler(event, context):
             )
             
         elif action == 'generate_specific':
-            if not posting_ids:
-                return {
-                    'statusCode': 400,
-                    'body': json.dumps({
-                        'error': 'posting_ids required for generate_specific action'
-                    })
-                }
-            
             print(f"Generating HTML for specific postings: {posting_ids}")
             results = generate_html_for_specific_postings(
                 posting_ids=posting_ids,
@@ -80,12 +119,14 @@ def lambda_handler(event, context):
             if success:
                 # Upload index.html to main bucket
                 try:
-                    s3_client.upload_file(
-                        'index.html', 
-                        s3_main_bucket, 
-                        'index.html',
-                        ExtraArgs={'ContentType': 'text/html; charset=utf-8'}
-                    )
+                    # A single put_object; the page is far below any multipart threshold
+                    with open('index.html', 'rb') as f:
+                        s3_client.put_object(
+                            Bucket=s3_main_bucket,
+                            Key='index.html',
+                            Body=gzip.compress(f.read(), compresslevel=HTML_GZIP_LEVEL),
+                            **INDEX_PAGE_UPLOAD_ARGS
+                        )
                     results = {
                         'success': True,
                         'message': f'index.html updated and uploaded to {s3_main_bucket}'
@@ -110,30 +151,22 @@ def lambda_handler(event, context):
                 'success': success,
                 'message': 'AI summary generation completed' if success else 'AI summary generation failed'
             }
-            
-        else:
-            return {
-                'statusCode': 400,
-                'body': json.dumps({
-                    'error': f'Unknown action: {action}'
-                })
-            }
         
         # Return success response
         return {
             'statusCode': 200,
-            'body': json.dumps({
+            'body': dumps_response_body({
                 'success': True,
                 'action': action,
                 'results': results
-            }, ensure_ascii=False)
+            })
         }
         
     except Exception as e:
         print(f"Lambda execution error: {str(e)}")
         return {
             'statusCode': 500,
-            'body': json.dumps({
+            'body': dumps_response_body({
                 'error': str(e),
                 'action': event.get('action', 'unknown')
             })
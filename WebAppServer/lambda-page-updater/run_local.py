@@ -15,12 +15,14 @@ def load_env_file(env_file='.env'):
         print("Please copy .env.example to .env and fill in your values.")
         return False
     
-    with open(env_path, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith('#') and '=' in line:
-                key, value = line.split('=', 1)
-                os.environ[key.strip()] = value.strip()
+    # Read the file once and apply all KEY=value pairs in a single update
+    env_vars = {}
+    for line in env_path.read_text().splitlines():
+        line = line.strip()
+        if line and not line.startswith('#') and '=' in line:
+            key, value = line.split('=', 1)
+            env_vars[key.strip()] = value.strip()
+    os.environ.update(env_vars)
     
     return True
 
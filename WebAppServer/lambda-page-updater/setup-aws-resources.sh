@@ -164,6 +164,56 @@ EOF
 aws s3api put-bucket-policy --bucket $DETAIL_BUCKET --policy file://detail-bucket-policy.json
 echo "✅ Detail pages bucket configured for public access"
 
+# Put CloudFront in front of both website endpoints
+# The managed CachingOptimized policy honors the Cache-Control headers set by the Lambda
+# and compresses responses (gzip/brotli) at the edge
+echo "🌍 Creating CloudFront distributions..."
+
+CACHING_OPTIMIZED_POLICY_ID="658327ea-f89d-4fab-a63d-7e88639e58f6"
+
+create_distribution() {
+    local BUCKET=$1
+    local ORIGIN_DOMAIN="$BUCKET.s3-website-$REGION.amazonaws.com"
+
+    cat > distribution-config.json << EOF
+{
+    "CallerReference": "$BUCKET-$(date +%s)",
+    "Comment": "WEPL $BUCKET",
+    "Enabled": true,
+    "DefaultRootObject": "index.html",
+    "Origins": {
+        "Quantity": 1,
+        "Items": [
+            {
+                "Id": "$BUCKET-website",
+                "DomainName": "$ORIGIN_DOMAIN",
+                "CustomOriginConfig": {
+                    "HTTPPort": 80,
+                    "HTTPSPort": 443,
+                    "OriginProtocolPolicy": "http-only"
+                }
+            }
+        ]
+    },
+    "DefaultCacheBehavior": {
+        "TargetOriginId": "$BUCKET-website",
+        "ViewerProtocolPolicy": "redirect-to-https",
+        "CachePolicyId": "$CACHING_OPTIMIZED_POLICY_ID",
+        "Compress": true
+    }
+}
+EOF
+
+    aws cloudfront create-distribution \
+        --distribution-config file://distribution-config.json \
+        --query 'Distribution.DomainName' --output text
+}
+
+MAIN_CDN_DOMAIN=$(create_distribution $MAIN_BUCKET)
+echo "✅ CloudFront distribution for $MAIN_BUCKET: $MAIN_CDN_DOMAIN"
+DETAIL_CDN_DOMAIN=$(create_distribution $DETAIL_BUCKET)
+echo "✅ CloudFront distribution for $DETAIL_BUCKET: $DETAIL_CDN_DOMAIN"
+
 # Display results
 echo ""
 echo "🎉 AWS resources setup completed!"
@@ -177,6 +227,8 @@ echo ""
 echo "🔗 Role ARN: arn:aws:iam::$ACCOUNT_ID:role/$ROLE_NAME"
 echo "🌐 Main website URL: http://$MAIN_BUCKET.s3-website-$REGION.amazonaws.com"
 echo "🌐 Detail pages URL: http://$DETAIL_BUCKET.s3-website-$REGION.amazonaws.com"
+echo "🌍 Main website CDN URL: https://$MAIN_CDN_DOMAIN"
+echo "🌍 Detail pages CDN URL: https://$DETAIL_CDN_DOMAIN"
 echo ""
 echo "📝 Next steps:"
 echo "1. Update the IAM_ROLE variable in deploy-lambda.sh with:"
@@ -185,6 +237,6 @@ echo "2. Run ./deploy-lambda.sh to deploy your Lambda function"
 echo "3. Upload your static files (script.js, style.css) to both S3 buckets"
 
 # Cleanup temporary files
-rm -f trust-policy.json lambda-policy.json main-bucket-policy.json detail-bucket-policy.json
+rm -f trust-policy.json lambda-policy.json main-bucket-policy.json detail-bucket-policy.json distribution-config.json
 
 echo "🧹 Cleanup completed"
\ No newline at end of file
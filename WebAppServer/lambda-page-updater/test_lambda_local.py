@@ -6,9 +6,21 @@ Tests the core functionality without requiring all dependencies
 import os
 import sys
 import json
+import importlib.util
+
+# Module loaded by the local-environment test, reused by the function tests
+_local_module = None
+
+def load_lambda_module():
+    """Execute lambda-render-pages.py as a fresh module (picks up the current environment)"""
+    spec = importlib.util.spec_from_file_location('lambda_render_pages', 'lambda-render-pages.py')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
 
 def test_local_configuration():
     """Test that the configuration works locally"""
+    global _local_module
     print("🏠 Testing Local Configuration")
     print("=" * 40)
     
@@ -32,9 +44,13 @@ def test_local_configuration():
             'pymysql': types.ModuleType('pymysql'),
             'boto3': types.ModuleType('boto3'),
             'botocore': types.ModuleType('botocore'),
+            'botocore.config': types.ModuleType('botocore.config'),
             'botocore.exceptions': types.ModuleType('botocore.exceptions')
         }
         
+        # Add mock client config
+        mock_modules['botocore.config'].Config = dict
+        
         # Add mock exceptions
         mock_modules['botocore.exceptions'].ClientError = Exception
         mock_modules['botocore.exceptions'].NoCredentialsError = Exception
@@ -44,22 +60,15 @@ def test_local_configuration():
             def get_secret_value(self, SecretId):
                 raise Exception("No credentials configured")
         
-        class MockSessionFail:
-            def client(self, service_name, region_name):
-                return MockSecretManagerFail()
-        
-        mock_modules['boto3'].session = types.ModuleType('session')
-        mock_modules['boto3'].session.Session = lambda: MockSessionFail()
+        mock_modules['boto3'].client = lambda service_name, region_name=None, config=None: MockSecretManagerFail()
         
         # Install mocks
         for name, module in mock_modules.items():
             sys.modules[name] = module
         
         # Now import our module
-        import importlib.util
-        spec = importlib.util.spec_from_file_location('lambda_render_pages', 'lambda-render-pages.py')
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
+        module = load_lambda_module()
+        _local_module = module
         
         # Test environment detection
         is_lambda = module.is_lambda_environment()
@@ -84,10 +93,6 @@ def test_local_configuration():
         # Set Lambda environment variable
         os.environ['AWS_LAMBDA_FUNCTION_NAME'] = 'test-function'
         
-        # Reload the module to pick up the environment change
-        spec = importlib.util.spec_from_file_location('lambda_render_pages', 'lambda-render-pages.py')
-        module = importlib.util.module_from_spec(spec)
-        
         # Mock successful secrets manager for Lambda test
         class MockSecretManagerSuccess:
             def get_secret_value(self, SecretId):
@@ -106,14 +111,10 @@ def test_local_configuration():
                     })
                 }
         
-        class MockSessionSuccess:
-            def client(self, service_name, region_name):
-                return MockSecretManagerSuccess()
-        
-        mock_modules['boto3'].session.Session = lambda: MockSessionSuccess()
+        mock_modules['boto3'].client = lambda service_name, region_name=None, config=None: MockSecretManagerSuccess()
         
-        # Reload with successful secrets
-        spec.loader.exec_module(module)
+        # Reload the module to pick up the environment change and successful secrets
+        module = load_lambda_module()
         
         # Test environment detection
         is_lambda = module.is_lambda_environment()
@@ -159,11 +160,8 @@ def test_core_functions():
             'rent': 500000
         }
         
-        # Import our module again for function testing
-        import importlib.util
-        spec = importlib.util.spec_from_file_location('lambda_render_pages', 'lambda-render-pages.py')
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
+        # Reuse the module from the local configuration test (load it if that test didn't run)
+        module = _local_module if _local_module is not None else load_lambda_module()
         
         # Test convert_to_posting_object function
         converted = module.convert_to_posting_object(test_posting)
@@ -195,6 +193,58 @@ def test_core_functions():
         traceback.print_exc()
         return False
 
+def test_index_round_trip():
+    """Test that index.html uploaded to S3 downloads back to the same HTML"""
+    print("\n🔁 Testing index.html S3 Round Trip")
+    print("=" * 40)
+    
+    import io
+    import tempfile
+    
+    # In-memory stand-in for the S3 client, keeping the headers put_object stores
+    class MockS3:
+        def __init__(self):
+            self.objects = {}
+        
+        def head_object(self, Bucket, Key):
+            if (Bucket, Key) not in self.objects:
+                raise Exception("Not Found")
+            return {'Metadata': self.objects[(Bucket, Key)].get('Metadata', {})}
+        
+        def put_object(self, Bucket, Key, Body, **kwargs):
+            self.objects[(Bucket, Key)] = dict(kwargs, Body=Body)
+        
+        def get_object(self, Bucket, Key):
+            stored = self.objects[(Bucket, Key)]
+            return dict(stored, Body=io.BytesIO(stored['Body']))
+    
+    try:
+        module = _local_module if _local_module is not None else load_lambda_module()
+        s3 = MockS3()
+        module.get_s3_client = lambda: s3
+        
+        html = ('<div id="housing-data" class="hidden">\n' + module.HOUSING_DATA_START_MARKER
+                + '        한눈에 공공임대\n' + module.HOUSING_DATA_END_MARKER + '</div>\n')
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            html_file_path = os.path.join(tmp_dir, 'index.html')
+            assert module.upload_index_html_to_s3(html_file_path, html_bytes=html.encode('utf-8'))
+            assert s3.objects[('wepl-mainpage', 'index.html')]['ContentEncoding'] == 'gzip'
+            
+            module.download_index_html_from_s3(html_file_path)
+            with open(html_file_path, encoding='utf-8') as f:
+                downloaded = f.read()
+        
+        assert downloaded == html, "Downloaded index.html should match the uploaded HTML"
+        assert module.split_housing_data(downloaded) is not None, "Housing-data markers should survive the round trip"
+        print("   ✅ upload_index_html_to_s3 / download_index_html_from_s3: PASS")
+        return True
+        
+    except Exception as e:
+        print(f"   ❌ Index round trip test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
 def show_deployment_info():
     """Show deployment information"""
     print("\n🚀 Deployment Information")
@@ -254,6 +304,13 @@ def main():
         print("\n❌ Function tests failed!")
         return False
     
+    # Test index.html S3 round trip
+    round_trip_success = test_index_round_trip()
+    
+    if not round_trip_success:
+        print("\n❌ Index round trip test failed!")
+        return False
+    
     # Show deployment info
     show_deployment_info()
     
@@ -37,6 +37,10 @@ class MockBoto3:
         def Session():
             return MockBoto3Session()
 
+    @staticmethod
+    def client(service_name, region_name=None, config=None):
+        return MockBoto3Session().client(service_name, region_name)
+
 # Mock the modules
 sys.modules['boto3'] = MockBoto3
 sys.modules['requests'] = type('MockModule', (), {})()
@@ -45,6 +49,7 @@ sys.modules['asyncio'] = type('MockModule', (), {})()
 sys.modules['ssl'] = type('MockModule', (), {})()
 sys.modules['pymysql'] = type('MockModule', (), {})()
 sys.modules['botocore'] = type('MockModule', (), {})()
+sys.modules['botocore.config'] = type('MockModule', (), {'Config': dict})()
 sys.modules['botocore.exceptions'] = type('MockModule', (), {
     'ClientError': Exception,
     'NoCredentialsError': Exception